@@ -0,0 +1,243 @@
+"""
+Shared Benchmark Harness
+
+BenchmarkResult and benchmark() used by the category benchmark modules
+(all seven categories run by run_all.py).
+
+Last Updated: 2025-12-28T1200
+"""
+
+import gc
+import math
+import os
+import sys
+import timeit
+from array import array
+from functools import cached_property, partial
+from itertools import repeat
+from typing import Sequence, Tuple
+
+
+# Optional: with NumPy installed, large sample sets get vectorized statistics,
+# and with Numba as well the moments come from one compiled pass (small runs
+# stay on the stdlib path, which has no conversion cost or JIT warmup)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_NUMPY_MIN_SAMPLES = 1_000
+_JIT_MIN_SAMPLES = 10_000
+
+if np is not None and njit is not None:
+    @njit(cache=True)
+    def _moments(a):
+        """(mean, stdev, min, max) of a float64 array in one Welford pass."""
+        mean = 0.0
+        m2 = 0.0
+        lo = a[0]
+        hi = a[0]
+        for i in range(a.size):
+            v = a[i]
+            delta = v - mean
+            mean += delta / (i + 1)
+            m2 += delta * (v - mean)
+            if v < lo:
+                lo = v
+            if v > hi:
+                hi = v
+        stdev = (m2 / (a.size - 1)) ** 0.5 if a.size > 1 else 0.0
+        return mean, stdev, lo, hi
+else:
+    njit = None
+
+
+def _summarize(times: Sequence[float]) -> Tuple[float, float, float, float, float]:
+    """
+    Return (mean, stdev, median, min, max) from one sort and fsum reductions,
+    or from NumPy (and the compiled _moments pass, with Numba) for large runs.
+    """
+    n = len(times)
+    if np is not None and n >= _NUMPY_MIN_SAMPLES:
+        a = np.asarray(times, dtype=np.float64)
+        if njit is not None and n >= _JIT_MIN_SAMPLES:
+            mean, stdev, lo, hi = _moments(a)
+        else:
+            mean, stdev, lo, hi = a.mean(), a.std(ddof=1), a.min(), a.max()
+        return float(mean), float(stdev), float(np.median(a)), float(lo), float(hi)
+
+    ordered = sorted(times)
+    mean = math.fsum(ordered) / n
+    stdev = math.sqrt(math.fsum((t - mean) ** 2 for t in ordered) / (n - 1)) if n > 1 else 0.0
+    mid = n // 2
+    median = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+    return mean, stdev, median, ordered[0], ordered[-1]
+
+
+_REPR_TMPL = "{}: {:.2f}ns ± {:.2f}ns (median: {:.2f}ns)"
+
+
+class BenchmarkResult:
+    """Stores benchmark timing results."""
+
+    def __init__(self, name: str, times_ns: Sequence[float]):
+        self.name = name
+        self.times_ns = times_ns
+        self.samples = len(times_ns)
+
+    # Statistics are computed on first access (one _summarize pass for all five)
+    @cached_property
+    def _stats(self) -> Tuple[float, float, float, float, float]:
+        return _summarize(self.times_ns)
+
+    @property
+    def mean_ns(self) -> float:
+        return self._stats[0]
+
+    @property
+    def std_dev_ns(self) -> float:
+        return self._stats[1]
+
+    @property
+    def median_ns(self) -> float:
+        return self._stats[2]
+
+    @property
+    def min_ns(self) -> float:
+        return self._stats[3]
+
+    @property
+    def max_ns(self) -> float:
+        return self._stats[4]
+
+    def __repr__(self):
+        return _REPR_TMPL.format(self.name, self.mean_ns, self.std_dev_ns, self.median_ns)
+
+
+# Thread switch interval while sampling (the 5 ms default is shorter than a
+# slow bench's batch); only matters if the bindings or the caller run threads
+_SAMPLE_SWITCH_INTERVAL_S = 1.0
+
+
+def _calibrate(timer: timeit.Timer, min_sample_s: float = 1e-3) -> Tuple[int, float]:
+    """
+    Find the smallest 1-2-5 call count whose batch takes at least min_sample_s.
+
+    Returns (calls per batch, seconds that batch took).
+    """
+    scale = 1
+    while True:
+        for factor in (1, 2, 5):
+            number = scale * factor
+            elapsed = timer.timeit(number)
+            if elapsed >= min_sample_s:
+                return number, elapsed
+        scale *= 10
+
+
+def benchmark(func, samples: int = 100, warmup: int = 10, setup=None) -> BenchmarkResult:
+    """
+    Benchmark a function with warmup and multiple samples.
+
+    Each sample times a batch of calls sized so the batch lasts ~1 ms and
+    records the per-call average; timeit pauses the GC during each batch, the
+    heap is collected after warmup, and the thread switch interval is raised
+    while sampling so no other thread is scheduled mid-batch.
+
+    Args:
+        func: Function to benchmark (no arguments, or one if setup is given)
+        samples: Number of timing samples to collect
+        warmup: Number of warmup iterations
+        setup: Optional callable run once, untimed; its return value is
+            passed to func on every call
+
+    Returns:
+        BenchmarkResult with timing statistics (per-call nanoseconds)
+    """
+    name = func.__name__
+    if setup is not None:
+        func = partial(func, setup())
+
+    for _ in repeat(None, warmup):
+        func()
+
+    # Drop warmup garbage so a pending collection is not carried into the run
+    gc.collect()
+
+    timer = timeit.Timer(func)
+    # Unboxed float64 buffer, allocated before sampling and filled by index
+    times_ns = array('d', [0.0]) * samples
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(_SAMPLE_SWITCH_INTERVAL_S)
+    try:
+        inner, _ = _calibrate(timer)
+        scale = 1e9 / inner
+        for i in range(samples):
+            times_ns[i] = timer.timeit(inner) * scale
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    return BenchmarkResult(name, times_ns)
+
+
+def _noop():
+    pass
+
+
+def driver_overhead_ns(samples: int = 20) -> float:
+    """
+    Median per-call time benchmark() reports for an empty function: the timeit
+    loop plus one Python call, included in every result from this harness.
+    """
+    return benchmark(_noop, samples=samples, warmup=0).median_ns
+
+
+# Command-line flag that hands a category module's benches to pyperf
+PYPERF_FLAG = "--pyperf"
+
+
+def run_pyperf(benchmarks, setups=None):
+    """
+    Run benchmarks under pyperf instead of benchmark().
+
+    pyperf spawns worker processes, calibrates loop counts and checks system
+    tuning; it reads its own options from the rest of the command line
+    (e.g. -o results.json, --rigorous). Setup callables are called once per
+    worker and their result is passed to the bench, as with benchmark().
+
+    Args:
+        benchmarks: Bench functions, run in order
+        setups: Optional mapping from bench function to its setup callable
+    """
+    try:
+        import pyperf
+    except ImportError:
+        print("ERROR: pyperf not found. Install with: pip install pyperf")
+        exit(1)
+
+    # Workers re-run the script, so they need the flag back to reach this path
+    sys.argv.remove(PYPERF_FLAG)
+    runner = pyperf.Runner(program_args=(sys.argv[0], PYPERF_FLAG))
+    for func in benchmarks:
+        setup = setups.get(func) if setups else None
+        if setup is None:
+            runner.bench_func(func.__name__, func)
+        else:
+            runner.bench_func(func.__name__, func, setup())
+
+
+def pin_to_core(core: int):
+    """Pin this process to one CPU and raise its priority where permitted."""
+    if not hasattr(os, 'sched_setaffinity'):
+        print("WARNING: CPU pinning is not supported on this platform", file=sys.stderr)
+        return
+    os.sched_setaffinity(0, {core})
+    try:
+        os.nice(-5)
+    except PermissionError:
+        print("WARNING: insufficient permissions to raise priority", file=sys.stderr)
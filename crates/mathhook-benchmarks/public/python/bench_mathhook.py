@@ -5,48 +5,120 @@ MathHook Python Benchmark Suite
 Comprehensive polynomial operation benchmarks using MathHook Python bindings.
 
 Usage:
-    python bench_mathhook.py [--json] [--iterations N]
+    python bench_mathhook.py [--json | --jsonl] [--iterations N | --adaptive] [--parallel] [--pin-core N]
+                             [--suite {poly,calc,core,all}]
 
-Output: JSON for baseline comparison or human-readable report.
+--suite=all also runs calculus_benchmarks.py and core_performance.py in this
+process, paying interpreter startup, the mathhook import and fixture parsing
+once; prefer it over separate invocations in CI.
+
+Output: JSON for baseline comparison, JSON Lines streamed per benchmark,
+or human-readable report.
 
 Last Updated: 2025-12-28T1200
 """
 
-import json
+import contextlib
+import gc
+import importlib
+import itertools
+import multiprocessing
+import os
 import sys
 import time
-import statistics
-import argparse
-from typing import Dict, Any, Callable
+import timeit
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Any, Callable, Iterable, Optional, Tuple
+
+from _bench_harness import _calibrate, _summarize, pin_to_core
 
 try:
-    from mathhook import parse, symbol, symbols, gcd
+    from mathhook import parse, symbol, symbols, gcd, poly_from_dense, poly_from_sparse
 except ImportError:
     print("Error: MathHook Python bindings not installed", file=sys.stderr)
     print("Install with: pip install mathhook", file=sys.stderr)
     sys.exit(1)
 
 
-def benchmark(func: Callable, iterations: int = 100, warmup: int = 10) -> Dict[str, float]:
-    """Run benchmark with statistical analysis."""
+# Adaptive sampling: aim for this much total timed work per benchmark
+_ADAPTIVE_TOTAL_S = 0.5
+_ADAPTIVE_MIN_SAMPLES = 30
+
+
+# Calls per loop iteration in the timed batch loop (divides every 1-2-5 count >= 10)
+_UNROLL = 10
+_UNROLLED: Dict[int, Callable] = {}
+
+
+def _make_inner(unroll: int) -> Callable:
+    """
+    Return a batch loop that calls func `unroll` times per iteration, built
+    from generated source (and cached per unroll factor) the way timeit does.
+    """
+    loop = _UNROLLED.get(unroll)
+    if loop is None:
+        src = ("def inner(_it, _timer, _func):\n"
+               "    _t0 = _timer()\n"
+               "    for _ in _it:\n"
+               + "        _func()\n" * unroll +
+               "    return _timer() - _t0\n")
+        namespace: Dict[str, Any] = {}
+        exec(compile(src, f"<unrolled x{unroll}>", "exec"), namespace)
+        loop = _UNROLLED[unroll] = namespace['inner']
+    return loop
+
+
+def _clock(raw: bool) -> Callable[[], float]:
+    """Timing clock: perf_counter, or CLOCK_MONOTONIC_RAW (immune to NTP slewing) if raw."""
+    if raw and hasattr(time, 'CLOCK_MONOTONIC_RAW'):
+        return partial(time.clock_gettime, time.CLOCK_MONOTONIC_RAW)
+    return timeit.default_timer
+
+
+def benchmark(func: Callable, iterations: Optional[int] = 100, warmup: int = 10,
+              clock: Callable[[], float] = timeit.default_timer) -> Dict[str, float]:
+    """
+    Run benchmark with statistical analysis.
+
+    Each sample times a batch of calls (sized so the batch lasts ~1 ms) and
+    records the per-call average, amortizing timer overhead for fast kernels.
+    The batch loop is unrolled (see _make_inner) so loop dispatch is paid once
+    per _UNROLL calls, and the garbage collector is paused while sampling.
+
+    iterations=None picks the sample count adaptively: enough ~1 ms batches
+    to fill ~0.5 s (at least 30), so fast kernels get more samples and slow
+    ones fewer.
+
+    Statistics are computed after sampling (see _bench_harness._summarize),
+    so the loop between timed batches only stores each sample.
+    """
     # Warmup
-    for _ in range(warmup):
+    for _ in itertools.repeat(None, warmup):
         func()
 
-    # Collect timing samples
+    # Collect timing samples (per-call nanoseconds)
+    timer = timeit.Timer(func, timer=clock)
+    inner, batch_s = _calibrate(timer)
+    if iterations is None:
+        iterations = max(_ADAPTIVE_MIN_SAMPLES, int(_ADAPTIVE_TOTAL_S / batch_s))
+    unroll = math.gcd(inner, _UNROLL)
+    loop = _make_inner(unroll)
+    reps = inner // unroll
+
     times = []
-    for _ in range(iterations):
-        start = time.perf_counter_ns()
-        func()
-        end = time.perf_counter_ns()
-        times.append(end - start)
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in itertools.repeat(None, iterations):
+            times.append(loop(itertools.repeat(None, reps), clock, func) * 1e9 / inner)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
 
     # Statistics in nanoseconds
-    mean_ns = statistics.mean(times)
-    stdev_ns = statistics.stdev(times) if len(times) > 1 else 0
-    median_ns = statistics.median(times)
-    min_ns = min(times)
-    max_ns = max(times)
+    mean_ns, stdev_ns, median_ns, min_ns, max_ns = _summarize(times)
 
     return {
         'mean_ns': mean_ns,
@@ -54,10 +126,14 @@ def benchmark(func: Callable, iterations: int = 100, warmup: int = 10) -> Dict[s
         'median_ns': median_ns,
         'min_ns': min_ns,
         'max_ns': max_ns,
-        'iterations': iterations
+        'iterations': iterations,
+        'inner_loops': inner
     }
 
 
+# Parsing inputs (built once so parse benches time only the parser)
+_PARSE_LARGE_SRC = " + ".join(f"{i+1}*x^{i}" for i in range(21))
+
 # GCD expressions (pre-parsed for fair benchmarking)
 _gcd_simple_f = parse("x^2 - 1")
 _gcd_simple_g = parse("x - 1")
@@ -78,18 +154,18 @@ _gcd_trivariate_f = parse("x*y*z")
 _gcd_trivariate_g = parse("x*y")
 
 # Multiplication expressions
-_mul_simple_f = parse("x + 1")
-_mul_simple_g = parse("x + 1")
+# Squaring benches share one operand object; expressions are immutable and
+# the binary operators return new objects
+_mul_simple_f = _mul_simple_g = parse("x + 1")
 
 _mul_medium_f = parse("x^10 + x^9 + x^8 + x^7 + x^6 + x^5 + x^4 + x^3 + x^2 + x + 1")
 _mul_medium_g = parse("2*x^10 + 2*x^9 + 2*x^8 + 2*x^7 + 2*x^6 + 2*x^5 + 2*x^4 + 2*x^3 + 2*x^2 + 2*x + 2")
 
-_mul_large_terms = " + ".join([f"x^{i}" for i in range(51)])
-_mul_large_f = parse(_mul_large_terms)
-_mul_large_g = parse(_mul_large_terms)
+# Large/sparse operands are built from coefficients directly (no parser work)
+_mul_large_f = _mul_large_g = poly_from_dense([1] * 51, 'x')
 
-_mul_sparse_f = parse("1 + x^50 + x^100")
-_mul_sparse_g = parse("1 + x^25 + x^75")
+_mul_sparse_f = poly_from_sparse({0: 1, 50: 1, 100: 1}, 'x')
+_mul_sparse_g = poly_from_sparse({0: 1, 25: 1, 75: 1}, 'x')
 
 # Division expressions
 _div_simple_f = parse("x^2 - 1")
@@ -127,8 +203,7 @@ def bench_parse_medium():
 
 def bench_parse_large():
     """Parse large polynomial (degree 20)."""
-    terms = " + ".join([f"{i+1}*x^{i}" for i in range(21)])
-    return parse(terms)
+    return parse(_PARSE_LARGE_SRC)
 
 def bench_parse_multivariate():
     """Parse multivariate polynomial."""
@@ -249,49 +324,124 @@ def bench_factor_quadratic():
 # MAIN BENCHMARK RUNNER
 # ============================================================================
 
-def run_all_benchmarks(iterations: int = 100) -> Dict[str, Any]:
-    """Run all benchmarks and return results."""
-
-    benchmarks = {
-        # Parsing (with string processing overhead - this is expected)
-        'parse_simple': bench_parse_simple,
-        'parse_medium': bench_parse_medium,
-        'parse_large': bench_parse_large,
-        'parse_multivariate': bench_parse_multivariate,
-
-        # GCD (using pre-parsed expressions for fair comparison)
-        'gcd_simple': bench_gcd_simple,
-        'gcd_medium': bench_gcd_medium,
-        'gcd_large': bench_gcd_large,
-        'gcd_with_content': bench_gcd_with_content,
-        'gcd_bivariate': bench_gcd_bivariate,
-        'gcd_trivariate': bench_gcd_trivariate,
-
-        # Multiplication (using pre-parsed expressions)
-        'mul_simple': bench_mul_simple,
-        'mul_medium': bench_mul_medium,
-        'mul_large': bench_mul_large,
-        'mul_sparse': bench_mul_sparse,
-
-        # Division (using pre-parsed expressions)
-        'div_simple': bench_div_simple,
-        'div_medium': bench_div_medium,
-
-        # Expansion (using pre-parsed expressions)
-        'expand_simple': bench_expand_simple,
-        'expand_medium': bench_expand_medium,
-        'expand_large': bench_expand_large,
-
-        # Simplification (using pre-parsed expressions)
-        'simplify_simple': bench_simplify_simple,
-        'simplify_polynomial': bench_simplify_polynomial,
-        'simplify_large': bench_simplify_large,
-
-        # Factorization (using pre-parsed expressions)
-        'factor_simple': bench_factor_simple,
-        'factor_quadratic': bench_factor_quadratic,
+# Suites selectable with --suite besides 'poly' (this module), by module name
+_SUITES = {
+    'calc': 'calculus_benchmarks',
+    'core': 'core_performance',
+}
+
+
+def _run_suite(suite: str, iterations: Optional[int]) -> Dict[str, Dict[str, Any]]:
+    """
+    Run another benchmark module in this process and return its results
+    keyed as '<suite>_<bench name>', in the same dict layout as benchmark().
+
+    The module's own progress output goes to stderr. Its benches are timed by
+    _bench_harness.benchmark (perf_counter, no unrolled loop), so raw_clock
+    does not apply; it has no adaptive mode, so iterations=None falls back to
+    100 samples.
+    """
+    module = importlib.import_module(_SUITES[suite])
+    with contextlib.redirect_stdout(sys.stderr):
+        suite_results = module.run_all_benchmarks(samples=iterations or 100)
+    return {
+        f"{suite}_{name[len('bench_'):]}": {
+            'mean_ns': result.mean_ns,
+            'stdev_ns': result.std_dev_ns,
+            'median_ns': result.median_ns,
+            'min_ns': result.min_ns,
+            'max_ns': result.max_ns,
+            'iterations': result.samples,
+        }
+        for name, result in suite_results.items()
     }
 
+
+def _run_one(task: Tuple[str, Optional[int], bool]) -> Tuple[str, Dict[str, Any]]:
+    """Run one benchmark by name (worker entry point for --parallel)."""
+    name, iterations, raw_clock = task
+    try:
+        return name, benchmark(globals()[f"bench_{name}"], iterations=iterations,
+                               clock=_clock(raw_clock))
+    except Exception as e:
+        return name, {'error': str(e)}
+
+
+# Every benchmark in run order, as (name, func) pairs
+_BENCHMARKS: Tuple[Tuple[str, Callable], ...] = (
+    # Parsing (with string processing overhead - this is expected)
+    ('parse_simple', bench_parse_simple),
+    ('parse_medium', bench_parse_medium),
+    ('parse_large', bench_parse_large),
+    ('parse_multivariate', bench_parse_multivariate),
+
+    # GCD (using pre-parsed expressions for fair comparison)
+    ('gcd_simple', bench_gcd_simple),
+    ('gcd_medium', bench_gcd_medium),
+    ('gcd_large', bench_gcd_large),
+    ('gcd_with_content', bench_gcd_with_content),
+    ('gcd_bivariate', bench_gcd_bivariate),
+    ('gcd_trivariate', bench_gcd_trivariate),
+
+    # Multiplication (using pre-parsed expressions)
+    ('mul_simple', bench_mul_simple),
+    ('mul_medium', bench_mul_medium),
+    ('mul_large', bench_mul_large),
+    ('mul_sparse', bench_mul_sparse),
+
+    # Division (using pre-parsed expressions)
+    ('div_simple', bench_div_simple),
+    ('div_medium', bench_div_medium),
+
+    # Expansion (using pre-parsed expressions)
+    ('expand_simple', bench_expand_simple),
+    ('expand_medium', bench_expand_medium),
+    ('expand_large', bench_expand_large),
+
+    # Simplification (using pre-parsed expressions)
+    ('simplify_simple', bench_simplify_simple),
+    ('simplify_polynomial', bench_simplify_polynomial),
+    ('simplify_large', bench_simplify_large),
+
+    # Factorization (using pre-parsed expressions)
+    ('factor_simple', bench_factor_simple),
+    ('factor_quadratic', bench_factor_quadratic),
+)
+
+
+def run_all_benchmarks(iterations: Optional[int] = 100, parallel: bool = False,
+                       include: Optional[Iterable[str]] = None,
+                       raw_clock: bool = False, jsonl: bool = False,
+                       suites: Iterable[str] = ('poly',)) -> Dict[str, Any]:
+    """
+    Run all benchmarks and return results.
+
+    iterations=None lets each benchmark choose its sample count adaptively.
+
+    include restricts the run to benchmarks whose name starts with one of
+    the given prefixes (e.g. {'gcd_', 'mul_'}); None runs everything.
+    raw_clock times with CLOCK_MONOTONIC_RAW where available.
+
+    With jsonl=True each result is written to stdout as one JSON line as soon
+    as it finishes (and not kept in the returned 'benchmarks' dict).
+
+    With parallel=True the benchmarks are spread over a spawn-based process
+    pool. This cuts wall time, but concurrent runs contend for caches and
+    memory bandwidth, so keep the serial default for baseline numbers.
+
+    suites picks what to run: 'poly' is this module's benchmarks, 'calc' and
+    'core' run the calculus/core modules in-process (always serially, and
+    not filtered by include).
+    """
+    suites = tuple(suites)
+    if 'poly' not in suites:
+        benchmarks = ()
+    elif include is not None:
+        prefixes = tuple(include)
+        benchmarks = tuple((name, func) for name, func in _BENCHMARKS if name.startswith(prefixes))
+    else:
+        benchmarks = _BENCHMARKS
+
     results = {
         'platform': 'python-mathhook',
         'binding': 'PyO3',
@@ -299,18 +449,76 @@ def run_all_benchmarks(iterations: int = 100) -> Dict[str, Any]:
         'benchmarks': {}
     }
 
-    for name, func in benchmarks.items():
-        try:
-            print(f"Running {name}...", file=sys.stderr)
-            result = benchmark(func, iterations=iterations)
+    if jsonl:
+        import json
+
+    def record(name: str, result: Dict[str, Any]):
+        if jsonl:
+            sys.stdout.write(json.dumps({'name': name, **result}) + '\n')
+            sys.stdout.flush()
+        else:
             results['benchmarks'][name] = result
-        except Exception as e:
-            print(f"Error in {name}: {e}", file=sys.stderr)
-            results['benchmarks'][name] = {'error': str(e)}
+
+    # Move the long-lived fixtures into the permanent generation so the
+    # collector stops re-scanning them while benchmarks run; unfrozen after,
+    # since library callers (compare_baseline.py) keep using their heap
+    gc.collect()
+    gc.freeze()
+    try:
+        if parallel and benchmarks:
+            workers = min(len(benchmarks), os.cpu_count() or 1)
+            print(f"Running {len(benchmarks)} benchmarks on {workers} workers...", file=sys.stderr)
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                for name, result in executor.map(_run_one, [(name, iterations, raw_clock) for name, _ in benchmarks]):
+                    if 'error' in result:
+                        print(f"Error in {name}: {result['error']}", file=sys.stderr)
+                    record(name, result)
+        else:
+            for name, func in benchmarks:
+                try:
+                    print(f"Running {name}...", file=sys.stderr)
+                    result = benchmark(func, iterations=iterations, clock=_clock(raw_clock))
+                except Exception as e:
+                    print(f"Error in {name}: {e}", file=sys.stderr)
+                    result = {'error': str(e)}
+                record(name, result)
+
+        for suite in _SUITES:
+            if suite in suites:
+                for name, result in _run_suite(suite, iterations).items():
+                    record(name, result)
+    finally:
+        gc.unfreeze()
 
     return results
 
 
+# Report categories in display order, keyed by benchmark-name prefix
+_CAT_ORDER: Tuple[Tuple[str, str], ...] = (
+    ('Parsing', 'parse_'),
+    ('GCD', 'gcd_'),
+    ('Multiplication', 'mul_'),
+    ('Division', 'div_'),
+    ('Expansion', 'expand_'),
+    ('Simplification', 'simplify_'),
+    ('Factorization', 'factor_'),
+    ('Calculus', 'calc_'),
+    ('Core', 'core_'),
+)
+_CAT_BY_PREFIX = {prefix: category for category, prefix in _CAT_ORDER}
+
+
+# Report row templates (format specs parsed once, not per row)
+_ROW_TMPL = "  {:30s} {:12.2f} us  (stdev: {:8.2f} us)"
+_ERROR_ROW_TMPL = "  {:30s} ERROR: {}"
+
+
+def _category_of(name: str) -> Optional[str]:
+    """Report category for a benchmark name (its prefix up to the first '_')."""
+    return _CAT_BY_PREFIX.get(name[:name.find('_') + 1])
+
+
 def print_human_readable(results: Dict[str, Any]):
     """Print results in human-readable format."""
     print("=" * 80)
@@ -319,38 +527,78 @@ def print_human_readable(results: Dict[str, Any]):
     print(f"Binding: {results['binding']}")
     print(f"Python version: {results['python_version']}")
 
-    categories = {
-        'Parsing': ['parse_'],
-        'GCD': ['gcd_'],
-        'Multiplication': ['mul_'],
-        'Division': ['div_'],
-        'Expansion': ['expand_'],
-        'Simplification': ['simplify_'],
-        'Factorization': ['factor_'],
-    }
+    grouped = {category: [] for category, _ in _CAT_ORDER}
+    for name, data in results['benchmarks'].items():
+        category = _category_of(name)
+        if category is not None:
+            grouped[category].append((name, data))
 
-    for category, prefixes in categories.items():
+    for category, _ in _CAT_ORDER:
+        rows = grouped[category]
+        if not rows:
+            continue
         print(f"\n{category}:")
         print("-" * 60)
 
-        for name, data in results['benchmarks'].items():
-            if any(name.startswith(p) for p in prefixes):
-                if 'error' in data:
-                    print(f"  {name:30s} ERROR: {data['error']}")
-                else:
-                    mean_us = data['mean_ns'] / 1000
-                    stdev_us = data['stdev_ns'] / 1000
-                    print(f"  {name:30s} {mean_us:12.2f} us  (stdev: {stdev_us:8.2f} us)")
+        for name, data in rows:
+            if 'error' in data:
+                print(_ERROR_ROW_TMPL.format(name, data['error']))
+            else:
+                print(_ROW_TMPL.format(name, data['mean_ns'] / 1000, data['stdev_ns'] / 1000))
+
+
+def _freeze_cpu_freq():
+    """Switch every CPU to the 'performance' cpufreq governor (root only)."""
+    import glob
+
+    governors = glob.glob('/sys/devices/system/cpu/cpu*/cpufreq/scaling_governor')
+    if not governors or os.geteuid() != 0:
+        print("WARNING: cannot set CPU governor (needs Linux cpufreq and root)", file=sys.stderr)
+        return
+    for path in governors:
+        with open(path, 'w') as f:
+            f.write('performance')
 
 
 def main():
+    # CLI-only imports, kept out of library imports and --parallel workers
+    import argparse
+    import json
+
     parser = argparse.ArgumentParser(description='MathHook Python Benchmarks')
     parser.add_argument('--json', action='store_true', help='Output JSON format')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='Stream one JSON line per benchmark as it completes')
     parser.add_argument('--iterations', type=int, default=100, help='Benchmark iterations')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='Choose samples per benchmark automatically (overrides --iterations)')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Run benchmarks concurrently in a process pool (faster, noisier)')
+    parser.add_argument('--raw-clock', action='store_true',
+                        help='Time with CLOCK_MONOTONIC_RAW instead of perf_counter (Linux; poly suite only)')
+    parser.add_argument('--pin-core', type=int, default=None, metavar='N',
+                        help='Pin the benchmark process to CPU N (Linux)')
+    parser.add_argument('--suite', choices=['poly', *_SUITES, 'all'], default='poly',
+                        help="Benchmark suite to run; 'all' runs every suite in one process. "
+                             "calc/core rows are timed by the shared harness (perf_counter; "
+                             "--raw-clock and the unrolled loop apply to poly only)")
+    parser.add_argument('--freeze-cpu-freq', action='store_true',
+                        help="Set the 'performance' cpufreq governor before running (root)")
     args = parser.parse_args()
 
-    results = run_all_benchmarks(iterations=args.iterations)
+    if args.pin_core is not None:
+        pin_to_core(args.pin_core)
+    if args.freeze_cpu_freq:
+        _freeze_cpu_freq()
+
+    iterations = None if args.adaptive else args.iterations
+    suites = ('poly', *_SUITES) if args.suite == 'all' else (args.suite,)
+    results = run_all_benchmarks(iterations=iterations, parallel=args.parallel,
+                                 raw_clock=args.raw_clock, jsonl=args.jsonl,
+                                 suites=suites)
 
+    if args.jsonl:
+        return
     if args.json:
         print(json.dumps(results, indent=2))
     else:
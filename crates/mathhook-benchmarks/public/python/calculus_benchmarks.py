@@ -7,48 +7,41 @@ Tests: Derivatives (power, product, chain, quotient rules), Integrals, Multi-var
 Last Updated: 2025-12-28T1200
 """
 
-import time
-import statistics
-from typing import Dict, List
+from typing import Dict
+
+from _bench_harness import BenchmarkResult, benchmark
 
 try:
-    from mathhook import symbol, symbols, parse, sin, cos, exp, log
+    from mathhook import symbol, parse, sin, cos, exp, log
 except ImportError:
     print("ERROR: mathhook Python bindings not found. Install with: pip install mathhook")
     exit(1)
 
 
-class BenchmarkResult:
-    """Stores benchmark timing results."""
-
-    def __init__(self, name: str, times_ns: List[int]):
-        self.name = name
-        self.times_ns = times_ns
-        self.mean_ns = statistics.mean(times_ns)
-        self.median_ns = statistics.median(times_ns)
-        self.min_ns = min(times_ns)
-        self.max_ns = max(times_ns)
-        self.std_dev_ns = statistics.stdev(times_ns) if len(times_ns) > 1 else 0.0
-        self.samples = len(times_ns)
-
-    def __repr__(self):
-        return (f"{self.name}: {self.mean_ns:.2f}ns ± {self.std_dev_ns:.2f}ns "
-                f"(median: {self.median_ns:.2f}ns)")
+# ============================================================================
+# Shared Symbols
+# ============================================================================
 
+_X = symbol('x')
+_Y = symbol('y')
 
-def benchmark(func, samples: int = 100, warmup: int = 10) -> BenchmarkResult:
-    """Benchmark a function with warmup and multiple samples."""
-    for _ in range(warmup):
-        func()
 
-    times_ns = []
-    for _ in range(samples):
-        start = time.perf_counter_ns()
-        func()
-        end = time.perf_counter_ns()
-        times_ns.append(end - start)
+# ============================================================================
+# Pre-parsed Expressions (inputs of the *_cached_parse benches)
+# ============================================================================
 
-    return BenchmarkResult(func.__name__, times_ns)
+_calc_derivative_power_rule_expr = parse("x^5")
+_calc_derivative_product_rule_expr = parse("x^2 * sin(x)")
+_calc_derivative_chain_rule_expr = parse("sin(x^2)")
+_calc_derivative_quotient_rule_expr = parse("(x^2 + 1) / (x - 1)")
+_calc_derivative_trigonometric_expr = parse("sin(x) + cos(x)")
+_calc_derivative_exponential_expr = parse("exp(2*x)")
+_calc_derivative_logarithmic_expr = parse("log(x^2)")
+_calc_integral_power_rule_expr = parse("x^5")
+_calc_integral_trigonometric_sin_expr = parse("sin(x)")
+_calc_integral_exponential_expr = parse("exp(x)")
+_calc_partial_derivative_x_expr = parse("x^2 + y^2")
+_calc_partial_derivative_y_expr = parse("x^2 + y^2")
 
 
 # ============================================================================
@@ -57,7 +50,7 @@ def benchmark(func, samples: int = 100, warmup: int = 10) -> BenchmarkResult:
 
 def bench_derivative_power_rule_direct():
     """Benchmark power rule derivative (direct API): d/dx(x^5)."""
-    x = symbol('x')
+    x = _X
     expr = x ** 5
     result = expr.derivative('x')
     return result
@@ -65,15 +58,19 @@ def bench_derivative_power_rule_direct():
 
 def bench_derivative_power_rule_with_parsing():
     """Benchmark power rule derivative (with parsing): d/dx(x^5)."""
-    x = symbol('x')
     expr = parse("x^5")
     result = expr.derivative('x')
     return result
 
 
+def bench_derivative_power_rule_cached_parse():
+    """Benchmark power rule derivative (cached parse): d/dx(x^5)."""
+    return _calc_derivative_power_rule_expr.derivative('x')
+
+
 def bench_derivative_product_rule_direct():
     """Benchmark product rule derivative (direct API): d/dx(x^2 * sin(x))."""
-    x = symbol('x')
+    x = _X
     expr = x**2 * sin(x)
     result = expr.derivative('x')
     return result
@@ -81,15 +78,19 @@ def bench_derivative_product_rule_direct():
 
 def bench_derivative_product_rule_with_parsing():
     """Benchmark product rule derivative (with parsing): d/dx(x^2 * sin(x))."""
-    x = symbol('x')
     expr = parse("x^2 * sin(x)")
     result = expr.derivative('x')
     return result
 
 
+def bench_derivative_product_rule_cached_parse():
+    """Benchmark product rule derivative (cached parse): d/dx(x^2 * sin(x))."""
+    return _calc_derivative_product_rule_expr.derivative('x')
+
+
 def bench_derivative_chain_rule_direct():
     """Benchmark chain rule derivative (direct API): d/dx(sin(x^2))."""
-    x = symbol('x')
+    x = _X
     expr = sin(x ** 2)
     result = expr.derivative('x')
     return result
@@ -97,15 +98,19 @@ def bench_derivative_chain_rule_direct():
 
 def bench_derivative_chain_rule_with_parsing():
     """Benchmark chain rule derivative (with parsing): d/dx(sin(x^2))."""
-    x = symbol('x')
     expr = parse("sin(x^2)")
     result = expr.derivative('x')
     return result
 
 
+def bench_derivative_chain_rule_cached_parse():
+    """Benchmark chain rule derivative (cached parse): d/dx(sin(x^2))."""
+    return _calc_derivative_chain_rule_expr.derivative('x')
+
+
 def bench_derivative_quotient_rule_direct():
     """Benchmark quotient rule derivative (direct API): d/dx((x^2+1)/(x-1))."""
-    x = symbol('x')
+    x = _X
     expr = (x**2 + 1) / (x - 1)
     result = expr.derivative('x')
     return result
@@ -113,15 +118,19 @@ def bench_derivative_quotient_rule_direct():
 
 def bench_derivative_quotient_rule_with_parsing():
     """Benchmark quotient rule derivative (with parsing): d/dx((x^2+1)/(x-1))."""
-    x = symbol('x')
     expr = parse("(x^2 + 1) / (x - 1)")
     result = expr.derivative('x')
     return result
 
 
+def bench_derivative_quotient_rule_cached_parse():
+    """Benchmark quotient rule derivative (cached parse): d/dx((x^2+1)/(x-1))."""
+    return _calc_derivative_quotient_rule_expr.derivative('x')
+
+
 def bench_derivative_trigonometric_direct():
     """Benchmark trigonometric derivative (direct API): d/dx(sin(x) + cos(x))."""
-    x = symbol('x')
+    x = _X
     expr = sin(x) + cos(x)
     result = expr.derivative('x')
     return result
@@ -129,15 +138,19 @@ def bench_derivative_trigonometric_direct():
 
 def bench_derivative_trigonometric_with_parsing():
     """Benchmark trigonometric derivative (with parsing): d/dx(sin(x) + cos(x))."""
-    x = symbol('x')
     expr = parse("sin(x) + cos(x)")
     result = expr.derivative('x')
     return result
 
 
+def bench_derivative_trigonometric_cached_parse():
+    """Benchmark trigonometric derivative (cached parse): d/dx(sin(x) + cos(x))."""
+    return _calc_derivative_trigonometric_expr.derivative('x')
+
+
 def bench_derivative_exponential_direct():
     """Benchmark exponential derivative (direct API): d/dx(exp(2x))."""
-    x = symbol('x')
+    x = _X
     expr = exp(2 * x)
     result = expr.derivative('x')
     return result
@@ -145,15 +158,19 @@ def bench_derivative_exponential_direct():
 
 def bench_derivative_exponential_with_parsing():
     """Benchmark exponential derivative (with parsing): d/dx(exp(2x))."""
-    x = symbol('x')
     expr = parse("exp(2*x)")
     result = expr.derivative('x')
     return result
 
 
+def bench_derivative_exponential_cached_parse():
+    """Benchmark exponential derivative (cached parse): d/dx(exp(2x))."""
+    return _calc_derivative_exponential_expr.derivative('x')
+
+
 def bench_derivative_logarithmic_direct():
     """Benchmark logarithmic derivative (direct API): d/dx(log(x^2))."""
-    x = symbol('x')
+    x = _X
     expr = log(x ** 2)
     result = expr.derivative('x')
     return result
@@ -161,19 +178,23 @@ def bench_derivative_logarithmic_direct():
 
 def bench_derivative_logarithmic_with_parsing():
     """Benchmark logarithmic derivative (with parsing): d/dx(log(x^2))."""
-    x = symbol('x')
     expr = parse("log(x^2)")
     result = expr.derivative('x')
     return result
 
 
+def bench_derivative_logarithmic_cached_parse():
+    """Benchmark logarithmic derivative (cached parse): d/dx(log(x^2))."""
+    return _calc_derivative_logarithmic_expr.derivative('x')
+
+
 # ============================================================================
 # Integration Benchmarks
 # ============================================================================
 
 def bench_integral_power_rule_direct():
     """Benchmark power rule integration (direct API): ∫x^5 dx."""
-    x = symbol('x')
+    x = _X
     expr = x ** 5
     result = expr.integrate('x')
     return result
@@ -181,15 +202,19 @@ def bench_integral_power_rule_direct():
 
 def bench_integral_power_rule_with_parsing():
     """Benchmark power rule integration (with parsing): ∫x^5 dx."""
-    x = symbol('x')
     expr = parse("x^5")
     result = expr.integrate('x')
     return result
 
 
+def bench_integral_power_rule_cached_parse():
+    """Benchmark power rule integration (cached parse): ∫x^5 dx."""
+    return _calc_integral_power_rule_expr.integrate('x')
+
+
 def bench_integral_trigonometric_sin_direct():
     """Benchmark trigonometric integration (direct API): ∫sin(x) dx."""
-    x = symbol('x')
+    x = _X
     expr = sin(x)
     result = expr.integrate('x')
     return result
@@ -197,15 +222,19 @@ def bench_integral_trigonometric_sin_direct():
 
 def bench_integral_trigonometric_sin_with_parsing():
     """Benchmark trigonometric integration (with parsing): ∫sin(x) dx."""
-    x = symbol('x')
     expr = parse("sin(x)")
     result = expr.integrate('x')
     return result
 
 
+def bench_integral_trigonometric_sin_cached_parse():
+    """Benchmark trigonometric integration (cached parse): ∫sin(x) dx."""
+    return _calc_integral_trigonometric_sin_expr.integrate('x')
+
+
 def bench_integral_exponential_direct():
     """Benchmark exponential integration (direct API): ∫exp(x) dx."""
-    x = symbol('x')
+    x = _X
     expr = exp(x)
     result = expr.integrate('x')
     return result
@@ -213,19 +242,23 @@ def bench_integral_exponential_direct():
 
 def bench_integral_exponential_with_parsing():
     """Benchmark exponential integration (with parsing): ∫exp(x) dx."""
-    x = symbol('x')
     expr = parse("exp(x)")
     result = expr.integrate('x')
     return result
 
 
+def bench_integral_exponential_cached_parse():
+    """Benchmark exponential integration (cached parse): ∫exp(x) dx."""
+    return _calc_integral_exponential_expr.integrate('x')
+
+
 # ============================================================================
 # Multi-variable Derivatives
 # ============================================================================
 
 def bench_partial_derivative_x_direct():
     """Benchmark partial derivative (direct API): ∂/∂x(x^2 + y^2)."""
-    x, y = symbols('x y')
+    x, y = _X, _Y
     expr = x**2 + y**2
     result = expr.derivative('x')
     return result
@@ -233,15 +266,19 @@ def bench_partial_derivative_x_direct():
 
 def bench_partial_derivative_x_with_parsing():
     """Benchmark partial derivative (with parsing): ∂/∂x(x^2 + y^2)."""
-    x = symbol('x')
     expr = parse("x^2 + y^2")
     result = expr.derivative('x')
     return result
 
 
+def bench_partial_derivative_x_cached_parse():
+    """Benchmark partial derivative (cached parse): ∂/∂x(x^2 + y^2)."""
+    return _calc_partial_derivative_x_expr.derivative('x')
+
+
 def bench_partial_derivative_y_direct():
     """Benchmark partial derivative (direct API): ∂/∂y(x^2 + y^2)."""
-    x, y = symbols('x y')
+    x, y = _X, _Y
     expr = x**2 + y**2
     result = expr.derivative('y')
     return result
@@ -249,12 +286,16 @@ def bench_partial_derivative_y_direct():
 
 def bench_partial_derivative_y_with_parsing():
     """Benchmark partial derivative (with parsing): ∂/∂y(x^2 + y^2)."""
-    y = symbol('y')
     expr = parse("x^2 + y^2")
     result = expr.derivative('y')
     return result
 
 
+def bench_partial_derivative_y_cached_parse():
+    """Benchmark partial derivative (cached parse): ∂/∂y(x^2 + y^2)."""
+    return _calc_partial_derivative_y_expr.derivative('y')
+
+
 # ============================================================================
 # Benchmark Runner
 # ============================================================================
@@ -267,32 +308,44 @@ def run_all_benchmarks(samples: int = 100) -> Dict[str, BenchmarkResult]:
         # Derivatives
         bench_derivative_power_rule_direct,
         bench_derivative_power_rule_with_parsing,
+        bench_derivative_power_rule_cached_parse,
         bench_derivative_product_rule_direct,
         bench_derivative_product_rule_with_parsing,
+        bench_derivative_product_rule_cached_parse,
         bench_derivative_chain_rule_direct,
         bench_derivative_chain_rule_with_parsing,
+        bench_derivative_chain_rule_cached_parse,
         bench_derivative_quotient_rule_direct,
         bench_derivative_quotient_rule_with_parsing,
+        bench_derivative_quotient_rule_cached_parse,
         bench_derivative_trigonometric_direct,
         bench_derivative_trigonometric_with_parsing,
+        bench_derivative_trigonometric_cached_parse,
         bench_derivative_exponential_direct,
         bench_derivative_exponential_with_parsing,
+        bench_derivative_exponential_cached_parse,
         bench_derivative_logarithmic_direct,
         bench_derivative_logarithmic_with_parsing,
+        bench_derivative_logarithmic_cached_parse,
 
         # Integrals
         bench_integral_power_rule_direct,
         bench_integral_power_rule_with_parsing,
+        bench_integral_power_rule_cached_parse,
         bench_integral_trigonometric_sin_direct,
         bench_integral_trigonometric_sin_with_parsing,
+        bench_integral_trigonometric_sin_cached_parse,
         bench_integral_exponential_direct,
         bench_integral_exponential_with_parsing,
+        bench_integral_exponential_cached_parse,
 
         # Multi-variable
         bench_partial_derivative_x_direct,
         bench_partial_derivative_x_with_parsing,
+        bench_partial_derivative_x_cached_parse,
         bench_partial_derivative_y_direct,
         bench_partial_derivative_y_with_parsing,
+        bench_partial_derivative_y_cached_parse,
     ]
 
     print("=" * 80)
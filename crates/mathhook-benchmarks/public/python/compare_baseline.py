@@ -6,7 +6,7 @@ Runs current benchmarks and compares against stored baseline.
 Detects performance regressions and improvements.
 
 Usage:
-    python compare_baseline.py [--iterations N] [--threshold PERCENT]
+    python compare_baseline.py [--iterations N] [--threshold PERCENT] [--only PREFIX[,PREFIX...]]
 
 Exit Codes:
     0: No regressions detected
@@ -16,10 +16,8 @@ Exit Codes:
 Last Updated: 2025-11-29T2000
 """
 
-import json
 import sys
 from pathlib import Path
-import argparse
 
 # Add bench script to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -27,7 +25,9 @@ from bench_mathhook import run_all_benchmarks
 
 
 def load_baseline(baselines_dir: Path) -> dict:
-    """Load latest baseline from baselines directory."""
+    """Load latest baseline (single JSON document or JSON Lines) from baselines directory."""
+    import json
+
     latest_path = baselines_dir / 'latest.json'
 
     if not latest_path.exists():
@@ -36,7 +36,23 @@ def load_baseline(baselines_dir: Path) -> dict:
         sys.exit(2)
 
     with open(latest_path, 'r') as f:
-        return json.load(f)
+        content = f.read()
+
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        pass
+
+    # JSON Lines output from `bench_mathhook.py --jsonl`: one record per benchmark
+    benchmarks = {}
+    for line in content.splitlines():
+        if line.strip():
+            record = json.loads(line)
+            benchmarks[record.pop('name')] = record
+    return {
+        'metadata': {'git_commit': 'unknown', 'timestamp': 'unknown (JSON Lines baseline)'},
+        'benchmarks': benchmarks,
+    }
 
 
 def compare_benchmarks(current: dict, baseline: dict, threshold_percent: float) -> bool:
@@ -66,11 +82,11 @@ def compare_benchmarks(current: dict, baseline: dict, threshold_percent: float)
             print(f"SKIP {name:30s} (error in current)")
             continue
 
-        if name not in baseline_benches:
+        baseline_data = baseline_benches.get(name)
+        if baseline_data is None:
             print(f"NEW  {name:30s} (not in baseline)")
             continue
 
-        baseline_data = baseline_benches[name]
         if 'error' in baseline_data:
             print(f"SKIP {name:30s} (error in baseline)")
             continue
@@ -82,12 +98,13 @@ def compare_benchmarks(current: dict, baseline: dict, threshold_percent: float)
         percent_change = ((current_ns - baseline_ns) / baseline_ns) * 100
 
         # Categorize
-        if percent_change > threshold_percent:
-            regressions.append((name, percent_change, current_ns, baseline_ns))
-        elif percent_change < -threshold_percent:
-            improvements.append((name, percent_change, current_ns, baseline_ns))
+        entry = (name, percent_change, current_ns, baseline_ns)
+        if abs(percent_change) <= threshold_percent:
+            unchanged.append(entry)
+        elif percent_change > 0:
+            regressions.append(entry)
         else:
-            unchanged.append((name, percent_change, current_ns, baseline_ns))
+            improvements.append(entry)
 
     # Print results
     if regressions:
@@ -117,12 +134,17 @@ def compare_benchmarks(current: dict, baseline: dict, threshold_percent: float)
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description='Compare Against Python Baseline')
     parser.add_argument('--iterations', type=int, default=100,
                         help='Number of benchmark iterations (default: 100)')
     parser.add_argument('--threshold', type=float, default=10.0,
                         help='Regression threshold percentage (default: 10.0)')
+    parser.add_argument('--only', type=str, default=None, metavar='PREFIX[,PREFIX...]',
+                        help='Only run benchmarks whose name starts with one of these prefixes (e.g. gcd_,mul_)')
     args = parser.parse_args()
+    include = set(args.only.split(',')) if args.only else None
 
     # Determine baselines directory
     script_dir = Path(__file__).parent
@@ -133,6 +155,8 @@ def main():
     print("=" * 80)
     print(f"Iterations: {args.iterations}")
     print(f"Threshold: {args.threshold}%")
+    if include:
+        print(f"Only: {', '.join(sorted(include))}")
     print()
 
     # Load baseline
@@ -141,7 +165,7 @@ def main():
 
     # Run current benchmarks
     print("Running current benchmarks...")
-    current = run_all_benchmarks(iterations=args.iterations)
+    current = run_all_benchmarks(iterations=args.iterations, include=include)
 
     # Compare
     has_regressions = compare_benchmarks(current, baseline, args.threshold)
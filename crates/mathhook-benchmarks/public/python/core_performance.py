@@ -7,60 +7,31 @@ Tests: Expression creation, simplification, basic solving, polynomial operations
 Last Updated: 2025-12-28T1200
 """
 
-import time
-import statistics
-from typing import Dict, List
+from typing import Dict
+
+from _bench_harness import BenchmarkResult, benchmark
 
 try:
-    from mathhook import symbol, symbols, parse, solve
+    from mathhook import symbol, symbols, parse, parse_and_simplify, solve
 except ImportError:
     print("ERROR: mathhook Python bindings not found. Install with: pip install mathhook")
     exit(1)
 
 
-class BenchmarkResult:
-    """Stores benchmark timing results."""
-
-    def __init__(self, name: str, times_ns: List[int]):
-        self.name = name
-        self.times_ns = times_ns
-        self.mean_ns = statistics.mean(times_ns)
-        self.median_ns = statistics.median(times_ns)
-        self.min_ns = min(times_ns)
-        self.max_ns = max(times_ns)
-        self.std_dev_ns = statistics.stdev(times_ns) if len(times_ns) > 1 else 0.0
-        self.samples = len(times_ns)
-
-    def __repr__(self):
-        return (f"{self.name}: {self.mean_ns:.2f}ns ± {self.std_dev_ns:.2f}ns "
-                f"(median: {self.median_ns:.2f}ns, range: [{self.min_ns:.2f}, {self.max_ns:.2f}])")
-
-
-def benchmark(func, samples: int = 100, warmup: int = 10) -> BenchmarkResult:
-    """
-    Benchmark a function with warmup and multiple samples.
+# ============================================================================
+# Shared Symbols
+# ============================================================================
 
-    Args:
-        func: Function to benchmark (no arguments)
-        samples: Number of timing samples to collect
-        warmup: Number of warmup iterations
+_X = symbol('x')
 
-    Returns:
-        BenchmarkResult with timing statistics
-    """
-    # Warmup
-    for _ in range(warmup):
-        func()
 
-    # Collect samples
-    times_ns = []
-    for _ in range(samples):
-        start = time.perf_counter_ns()
-        func()
-        end = time.perf_counter_ns()
-        times_ns.append(end - start)
+# ============================================================================
+# Pre-parsed Expressions (inputs of the *_cached_parse benches)
+# ============================================================================
 
-    return BenchmarkResult(func.__name__, times_ns)
+_core_simplification_expr = parse("2 + 3 + 5")
+_core_solving_expr = parse("x - 42")
+_core_polynomial_simplification_expr = parse("x^2 - 5*x + 6")
 
 
 # ============================================================================
@@ -69,7 +40,7 @@ def benchmark(func, samples: int = 100, warmup: int = 10) -> BenchmarkResult:
 
 def bench_expression_creation_direct():
     """Benchmark expression creation (direct API, no parsing)."""
-    x = symbol('x')
+    x = _X
     expr = x + 42
     return expr
 
@@ -82,7 +53,7 @@ def bench_expression_creation_with_parsing():
 
 def bench_simplification_direct():
     """Benchmark simplification (direct API, no parsing)."""
-    x = symbol('x')
+    x = _X
     expr = x + x + x
     result = expr.simplify()
     return result
@@ -90,9 +61,17 @@ def bench_simplification_direct():
 
 def bench_simplification_with_parsing():
     """Benchmark simplification (with parsing)."""
-    expr = parse("2 + 3 + 5")
-    result = expr.simplify()
-    return result
+    return parse_and_simplify("2 + 3 + 5")
+
+
+def bench_simplification_cached_parse():
+    """Benchmark simplification (cached parse)."""
+    return _core_simplification_expr.simplify()
+
+
+def bench_simplification_parse_only():
+    """Benchmark simplification input parsing alone (parser cost, no operation)."""
+    return parse("2 + 3 + 5")
 
 
 # ============================================================================
@@ -101,7 +80,7 @@ def bench_simplification_with_parsing():
 
 def bench_basic_solving_direct():
     """Benchmark basic equation solving (direct API, no parsing)."""
-    x = symbol('x')
+    x = _X
     equation = x - 42  # x = 42
     solutions = solve(equation, 'x')
     return solutions
@@ -113,13 +92,23 @@ def bench_basic_solving_with_parsing():
     return solutions
 
 
+def bench_basic_solving_cached_parse():
+    """Benchmark basic equation solving (cached parse)."""
+    return solve(_core_solving_expr, 'x')
+
+
+def bench_basic_solving_parse_only():
+    """Benchmark basic equation solving input parsing alone (parser cost, no operation)."""
+    return parse("x - 42")
+
+
 # ============================================================================
 # Polynomial Operations Benchmarks
 # ============================================================================
 
 def bench_polynomial_creation_direct():
     """Benchmark polynomial creation (direct API, no parsing)."""
-    x = symbol('x')
+    x = _X
     # Create polynomial: x^10 + 2x^9 + ... + 10x + 11
     poly = (x**10 + 2*x**9 + 3*x**8 + 4*x**7 + 5*x**6 +
             6*x**5 + 7*x**4 + 8*x**3 + 9*x**2 + 10*x + 11)
@@ -134,7 +123,7 @@ def bench_polynomial_creation_with_parsing():
 
 def bench_polynomial_simplification_direct():
     """Benchmark polynomial simplification (direct API, no parsing)."""
-    x = symbol('x')
+    x = _X
     poly = x**2 - 5*x + 6
     result = poly.simplify()
     return result
@@ -142,9 +131,17 @@ def bench_polynomial_simplification_direct():
 
 def bench_polynomial_simplification_with_parsing():
     """Benchmark polynomial simplification (with parsing)."""
-    poly = parse("x^2 - 5*x + 6")
-    result = poly.simplify()
-    return result
+    return parse_and_simplify("x^2 - 5*x + 6")
+
+
+def bench_polynomial_simplification_cached_parse():
+    """Benchmark polynomial simplification (cached parse)."""
+    return _core_polynomial_simplification_expr.simplify()
+
+
+def bench_polynomial_simplification_parse_only():
+    """Benchmark polynomial simplification input parsing alone (parser cost, no operation)."""
+    return parse("x^2 - 5*x + 6")
 
 
 # ============================================================================
@@ -155,7 +152,7 @@ def bench_expression_size_verification():
     """Benchmark expression size verification."""
     # Python objects don't have direct size like Rust's 32-byte constraint,
     # but we can benchmark object creation overhead
-    x = symbol('x')
+    x = _X
     expr = x ** 2
     return expr
 
@@ -182,16 +179,22 @@ def run_all_benchmarks(samples: int = 100) -> Dict[str, BenchmarkResult]:
         bench_expression_creation_with_parsing,
         bench_simplification_direct,
         bench_simplification_with_parsing,
+        bench_simplification_cached_parse,
+        bench_simplification_parse_only,
 
         # Solver operations
         bench_basic_solving_direct,
         bench_basic_solving_with_parsing,
+        bench_basic_solving_cached_parse,
+        bench_basic_solving_parse_only,
 
         # Polynomial operations
         bench_polynomial_creation_direct,
         bench_polynomial_creation_with_parsing,
         bench_polynomial_simplification_direct,
         bench_polynomial_simplification_with_parsing,
+        bench_polynomial_simplification_cached_parse,
+        bench_polynomial_simplification_parse_only,
 
         # Memory efficiency
         bench_expression_size_verification,
@@ -212,6 +215,29 @@ def run_all_benchmarks(samples: int = 100) -> Dict[str, BenchmarkResult]:
     return results
 
 
+# Split parser cost from operation cost: "parse" is the parser alone, "op
+# delta" is the operation on the parsed tree minus the direct-API run
+# (creation benches have no separate operation, so they compare the parsed
+# tree against building it directly). Rows: (label, direct, parse_only, parsed_op)
+_OVERHEAD_ROWS = (
+    ("expression_creation", "bench_expression_creation_direct", "bench_expression_creation_with_parsing", None),
+    ("simplification", "bench_simplification_direct", "bench_simplification_parse_only", "bench_simplification_cached_parse"),
+    ("solving", "bench_basic_solving_direct", "bench_basic_solving_parse_only", "bench_basic_solving_cached_parse"),
+    ("polynomial_creation", "bench_polynomial_creation_direct", "bench_polynomial_creation_with_parsing", None),
+    ("polynomial_simplification", "bench_polynomial_simplification_direct",
+     "bench_polynomial_simplification_parse_only", "bench_polynomial_simplification_cached_parse"),
+)
+
+
+def _overhead_report(results: Dict[str, BenchmarkResult]) -> str:
+    """Format the parse / op-delta table for a full run_all_benchmarks() result."""
+    return "\n".join(
+        f"{label:30s}: parse {results[parse_only].mean_ns:10.2f}ns   "
+        f"op delta {results[parsed_op or parse_only].mean_ns - results[direct].mean_ns:+10.2f}ns"
+        for label, direct, parse_only, parsed_op in _OVERHEAD_ROWS
+    )
+
+
 def main():
     """Main entry point for core performance benchmarks."""
     results = run_all_benchmarks(samples=100)
@@ -221,25 +247,9 @@ def main():
     for name, result in results.items():
         print(result)
 
-    # Calculate parsing overhead
     print("\nParsing Overhead Analysis:")
     print("-" * 80)
-
-    overhead_pairs = [
-        ("expression_creation", "bench_expression_creation_direct", "bench_expression_creation_with_parsing"),
-        ("simplification", "bench_simplification_direct", "bench_simplification_with_parsing"),
-        ("solving", "bench_basic_solving_direct", "bench_basic_solving_with_parsing"),
-        ("polynomial_creation", "bench_polynomial_creation_direct", "bench_polynomial_creation_with_parsing"),
-        ("polynomial_simplification", "bench_polynomial_simplification_direct", "bench_polynomial_simplification_with_parsing"),
-    ]
-
-    for label, direct, with_parsing in overhead_pairs:
-        if direct in results and with_parsing in results:
-            direct_time = results[direct].mean_ns
-            parsing_time = results[with_parsing].mean_ns
-            overhead_ns = parsing_time - direct_time
-            overhead_pct = (overhead_ns / direct_time) * 100 if direct_time > 0 else 0
-            print(f"{label:30s}: {overhead_ns:10.2f}ns ({overhead_pct:6.2f}%)")
+    print(_overhead_report(results))
 
 
 if __name__ == "__main__":
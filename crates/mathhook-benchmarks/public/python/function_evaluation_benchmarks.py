@@ -7,53 +7,88 @@ Tests: Elementary functions (trig, exp, log), special functions, composition
 Last Updated: 2025-12-28T1200
 """
 
-import time
-import statistics
-from typing import Dict, List
+from itertools import count
+from typing import Dict
+
+from _bench_harness import BenchmarkResult, benchmark
 
 try:
     from mathhook import (
         symbol, symbols, parse,
         sin, cos, tan, exp, log, sqrt, abs_expr,
         sinh, cosh, tanh, asin, acos, atan,
-        factorial, gamma
+        factorial, gamma, build_expr, parse_batch, simplify_many
     )
 except ImportError:
     print("ERROR: mathhook Python bindings not found. Install with: pip install mathhook")
     exit(1)
 
 
-class BenchmarkResult:
-    """Stores benchmark timing results."""
-
-    def __init__(self, name: str, times_ns: List[int]):
-        self.name = name
-        self.times_ns = times_ns
-        self.mean_ns = statistics.mean(times_ns)
-        self.median_ns = statistics.median(times_ns)
-        self.min_ns = min(times_ns)
-        self.max_ns = max(times_ns)
-        self.std_dev_ns = statistics.stdev(times_ns) if len(times_ns) > 1 else 0.0
-        self.samples = len(times_ns)
-
-    def __repr__(self):
-        return (f"{self.name}: {self.mean_ns:.2f}ns +/- {self.std_dev_ns:.2f}ns "
-                f"(median: {self.median_ns:.2f}ns)")
-
-
-def benchmark(func, samples: int = 100, warmup: int = 10) -> BenchmarkResult:
-    """Benchmark a function with warmup and multiple samples."""
-    for _ in range(warmup):
-        func()
-
-    times_ns = []
-    for _ in range(samples):
-        start = time.perf_counter_ns()
-        func()
-        end = time.perf_counter_ns()
-        times_ns.append(end - start)
+# ============================================================================
+# Shared Symbols
+# ============================================================================
 
-    return BenchmarkResult(func.__name__, times_ns)
+_X = symbol('x')
+_SIN_X = sin(_X)
+_COS_X = cos(_X)
+
+# sin^2(x) + cos^2(x) with its subtrees built once, so the direct bench times
+# only the simplifier's identity detection
+_SIN_X_SQ = _SIN_X**2
+_COS_X_SQ = _COS_X**2
+_PYTHAGOREAN_IDENTITY = _SIN_X_SQ + _COS_X_SQ
+
+# Already-simplified results, for the *_presimplified benches: simplify() on
+# these is the fixed-point cost, separating real rewriting from tree overhead
+_SIN_X_SIMPLIFIED = _SIN_X.simplify()
+_EXP_LOG_IDENTITY_SIMPLIFIED = exp(log(_X)).simplify()
+_SQRT_SQUARE_SIMPLIFIED = sqrt(_X ** 2).simplify()
+_PYTHAGOREAN_IDENTITY_SIMPLIFIED = _PYTHAGOREAN_IDENTITY.simplify()
+
+# The *_cold benches build on a never-seen symbol each call, so any cache the
+# simplifier keeps keyed on earlier trees misses (first-call cost, vs the hot
+# benches that simplify the same tree every sample)
+_FRESH_COUNTER = count()
+
+
+def _fresh_name(i: int) -> str:
+    return f"x{i}"
+
+
+def _fresh_symbol():
+    """A symbol whose name no earlier sample has used."""
+    return symbol(_fresh_name(next(_FRESH_COUNTER)))
+
+
+# Inputs of the *_simplify_cached_parse benches, parsed up front in one batch
+_PARSE_STRINGS = (
+    "sin(x)", "cos(x)", "tan(x)", "sin(cos(x))", "asin(x)",
+    "sinh(x)", "cosh(x)", "tanh(x)",
+    "exp(x)", "log(x)", "exp(log(x))", "exp(exp(x))",
+    "sqrt(x)", "sqrt(x^2)", "abs(x)", "abs(abs(x))",
+    "factorial(5)", "gamma(5)",
+    "sin(exp(x))", "log(sin(x) + cos(x))", "sin(cos(exp(log(x))))",
+    "sin(x)^2 + cos(x)^2", "2 * sin(x) * cos(x)",
+)
+_PARSED_INPUTS = parse_batch(_PARSE_STRINGS)
+(
+    _SIN_SYMBOLIC_PARSED, _COS_SYMBOLIC_PARSED, _TAN_SYMBOLIC_PARSED,
+    _NESTED_TRIG_PARSED, _ARCSIN_SYMBOLIC_PARSED,
+    _SINH_SYMBOLIC_PARSED, _COSH_SYMBOLIC_PARSED, _TANH_SYMBOLIC_PARSED,
+    _EXP_SYMBOLIC_PARSED, _LOG_SYMBOLIC_PARSED, _EXP_LOG_IDENTITY_PARSED, _NESTED_EXP_PARSED,
+    _SQRT_SYMBOLIC_PARSED, _SQRT_SQUARE_PARSED, _ABS_SYMBOLIC_PARSED, _NESTED_ABS_PARSED,
+    _FACTORIAL_SMALL_PARSED, _GAMMA_SYMBOLIC_PARSED,
+    _SIN_EXP_PARSED, _LOG_TRIG_SUM_PARSED, _DEEPLY_NESTED_PARSED,
+    _PYTHAGOREAN_IDENTITY_PARSED, _DOUBLE_ANGLE_PARSED,
+) = _PARSED_INPUTS
+
+
+# Nested inputs as build_expr specs (whole tree built in one FFI call; log is "ln")
+_X_SPEC = ("sym", "x")
+_NESTED_TRIG_SPEC = ("fn", "sin", (("fn", "cos", (_X_SPEC,)),))
+_EXP_LOG_IDENTITY_SPEC = ("fn", "exp", (("fn", "ln", (_X_SPEC,)),))
+_NESTED_EXP_SPEC = ("fn", "exp", (("fn", "exp", (_X_SPEC,)),))
+_DEEPLY_NESTED_SPEC = ("fn", "sin", (("fn", "cos", (_EXP_LOG_IDENTITY_SPEC,)),))
 
 
 # ============================================================================
@@ -62,77 +97,107 @@ def benchmark(func, samples: int = 100, warmup: int = 10) -> BenchmarkResult:
 
 def bench_sin_symbolic_direct():
     """Benchmark sin symbolic (direct API): sin(x)."""
-    x = symbol('x')
+    x = _X
     expr = sin(x)
     result = expr.simplify()
     return result
 
 
-def bench_sin_symbolic_with_parsing():
-    """Benchmark sin symbolic (with parsing): sin(x)."""
-    expr = parse("sin(x)")
-    result = expr.simplify()
-    return result
+def bench_sin_symbolic_presimplified():
+    """Benchmark sin symbolic (already simplified): sin(x)."""
+    return _SIN_X_SIMPLIFIED.simplify()
+
+
+def bench_sin_symbolic_cold():
+    """Benchmark sin symbolic (fresh symbol each call): sin(x_n)."""
+    return sin(_fresh_symbol()).simplify()
+
+
+def bench_sin_symbolic_parse_only():
+    """Benchmark sin symbolic (parse only): sin(x)."""
+    return parse("sin(x)")
+
+
+def bench_sin_symbolic_simplify_cached_parse():
+    """Benchmark sin symbolic (simplify of cached parse): sin(x)."""
+    return _SIN_SYMBOLIC_PARSED.simplify()
 
 
 def bench_cos_symbolic_direct():
     """Benchmark cos symbolic (direct API): cos(x)."""
-    x = symbol('x')
+    x = _X
     expr = cos(x)
     result = expr.simplify()
     return result
 
 
-def bench_cos_symbolic_with_parsing():
-    """Benchmark cos symbolic (with parsing): cos(x)."""
-    expr = parse("cos(x)")
-    result = expr.simplify()
-    return result
+def bench_cos_symbolic_parse_only():
+    """Benchmark cos symbolic (parse only): cos(x)."""
+    return parse("cos(x)")
+
+
+def bench_cos_symbolic_simplify_cached_parse():
+    """Benchmark cos symbolic (simplify of cached parse): cos(x)."""
+    return _COS_SYMBOLIC_PARSED.simplify()
 
 
 def bench_tan_symbolic_direct():
     """Benchmark tan symbolic (direct API): tan(x)."""
-    x = symbol('x')
+    x = _X
     expr = tan(x)
     result = expr.simplify()
     return result
 
 
-def bench_tan_symbolic_with_parsing():
-    """Benchmark tan symbolic (with parsing): tan(x)."""
-    expr = parse("tan(x)")
-    result = expr.simplify()
-    return result
+def bench_tan_symbolic_parse_only():
+    """Benchmark tan symbolic (parse only): tan(x)."""
+    return parse("tan(x)")
+
+
+def bench_tan_symbolic_simplify_cached_parse():
+    """Benchmark tan symbolic (simplify of cached parse): tan(x)."""
+    return _TAN_SYMBOLIC_PARSED.simplify()
 
 
 def bench_nested_trig_direct():
     """Benchmark nested trig (direct API): sin(cos(x))."""
-    x = symbol('x')
+    x = _X
     expr = sin(cos(x))
     result = expr.simplify()
     return result
 
 
-def bench_nested_trig_with_parsing():
-    """Benchmark nested trig (with parsing): sin(cos(x))."""
-    expr = parse("sin(cos(x))")
-    result = expr.simplify()
-    return result
+def bench_nested_trig_built():
+    """Benchmark nested trig (single build_expr call): sin(cos(x))."""
+    return build_expr(_NESTED_TRIG_SPEC).simplify()
+
+
+def bench_nested_trig_parse_only():
+    """Benchmark nested trig (parse only): sin(cos(x))."""
+    return parse("sin(cos(x))")
+
+
+def bench_nested_trig_simplify_cached_parse():
+    """Benchmark nested trig (simplify of cached parse): sin(cos(x))."""
+    return _NESTED_TRIG_PARSED.simplify()
 
 
 def bench_arcsin_symbolic_direct():
     """Benchmark arcsin symbolic (direct API): asin(x)."""
-    x = symbol('x')
+    x = _X
     expr = asin(x)
     result = expr.simplify()
     return result
 
 
-def bench_arcsin_symbolic_with_parsing():
-    """Benchmark arcsin symbolic (with parsing): asin(x)."""
-    expr = parse("asin(x)")
-    result = expr.simplify()
-    return result
+def bench_arcsin_symbolic_parse_only():
+    """Benchmark arcsin symbolic (parse only): asin(x)."""
+    return parse("asin(x)")
+
+
+def bench_arcsin_symbolic_simplify_cached_parse():
+    """Benchmark arcsin symbolic (simplify of cached parse): asin(x)."""
+    return _ARCSIN_SYMBOLIC_PARSED.simplify()
 
 
 # ============================================================================
@@ -141,47 +206,56 @@ def bench_arcsin_symbolic_with_parsing():
 
 def bench_sinh_symbolic_direct():
     """Benchmark sinh symbolic (direct API): sinh(x)."""
-    x = symbol('x')
+    x = _X
     expr = sinh(x)
     result = expr.simplify()
     return result
 
 
-def bench_sinh_symbolic_with_parsing():
-    """Benchmark sinh symbolic (with parsing): sinh(x)."""
-    expr = parse("sinh(x)")
-    result = expr.simplify()
-    return result
+def bench_sinh_symbolic_parse_only():
+    """Benchmark sinh symbolic (parse only): sinh(x)."""
+    return parse("sinh(x)")
+
+
+def bench_sinh_symbolic_simplify_cached_parse():
+    """Benchmark sinh symbolic (simplify of cached parse): sinh(x)."""
+    return _SINH_SYMBOLIC_PARSED.simplify()
 
 
 def bench_cosh_symbolic_direct():
     """Benchmark cosh symbolic (direct API): cosh(x)."""
-    x = symbol('x')
+    x = _X
     expr = cosh(x)
     result = expr.simplify()
     return result
 
 
-def bench_cosh_symbolic_with_parsing():
-    """Benchmark cosh symbolic (with parsing): cosh(x)."""
-    expr = parse("cosh(x)")
-    result = expr.simplify()
-    return result
+def bench_cosh_symbolic_parse_only():
+    """Benchmark cosh symbolic (parse only): cosh(x)."""
+    return parse("cosh(x)")
+
+
+def bench_cosh_symbolic_simplify_cached_parse():
+    """Benchmark cosh symbolic (simplify of cached parse): cosh(x)."""
+    return _COSH_SYMBOLIC_PARSED.simplify()
 
 
 def bench_tanh_symbolic_direct():
     """Benchmark tanh symbolic (direct API): tanh(x)."""
-    x = symbol('x')
+    x = _X
     expr = tanh(x)
     result = expr.simplify()
     return result
 
 
-def bench_tanh_symbolic_with_parsing():
-    """Benchmark tanh symbolic (with parsing): tanh(x)."""
-    expr = parse("tanh(x)")
-    result = expr.simplify()
-    return result
+def bench_tanh_symbolic_parse_only():
+    """Benchmark tanh symbolic (parse only): tanh(x)."""
+    return parse("tanh(x)")
+
+
+def bench_tanh_symbolic_simplify_cached_parse():
+    """Benchmark tanh symbolic (simplify of cached parse): tanh(x)."""
+    return _TANH_SYMBOLIC_PARSED.simplify()
 
 
 # ============================================================================
@@ -190,62 +264,94 @@ def bench_tanh_symbolic_with_parsing():
 
 def bench_exp_symbolic_direct():
     """Benchmark exp symbolic (direct API): exp(x)."""
-    x = symbol('x')
+    x = _X
     expr = exp(x)
     result = expr.simplify()
     return result
 
 
-def bench_exp_symbolic_with_parsing():
-    """Benchmark exp symbolic (with parsing): exp(x)."""
-    expr = parse("exp(x)")
-    result = expr.simplify()
-    return result
+def bench_exp_symbolic_parse_only():
+    """Benchmark exp symbolic (parse only): exp(x)."""
+    return parse("exp(x)")
+
+
+def bench_exp_symbolic_simplify_cached_parse():
+    """Benchmark exp symbolic (simplify of cached parse): exp(x)."""
+    return _EXP_SYMBOLIC_PARSED.simplify()
 
 
 def bench_log_symbolic_direct():
     """Benchmark log symbolic (direct API): log(x)."""
-    x = symbol('x')
+    x = _X
     expr = log(x)
     result = expr.simplify()
     return result
 
 
-def bench_log_symbolic_with_parsing():
-    """Benchmark log symbolic (with parsing): log(x)."""
-    expr = parse("log(x)")
-    result = expr.simplify()
-    return result
+def bench_log_symbolic_parse_only():
+    """Benchmark log symbolic (parse only): log(x)."""
+    return parse("log(x)")
+
+
+def bench_log_symbolic_simplify_cached_parse():
+    """Benchmark log symbolic (simplify of cached parse): log(x)."""
+    return _LOG_SYMBOLIC_PARSED.simplify()
 
 
 def bench_exp_log_identity_direct():
     """Benchmark exp(log(x)) identity (direct API)."""
-    x = symbol('x')
+    x = _X
     expr = exp(log(x))
     result = expr.simplify()
     return result
 
 
-def bench_exp_log_identity_with_parsing():
-    """Benchmark exp(log(x)) identity (with parsing)."""
-    expr = parse("exp(log(x))")
-    result = expr.simplify()
-    return result
+def bench_exp_log_identity_presimplified():
+    """Benchmark exp(log(x)) identity (already simplified)."""
+    return _EXP_LOG_IDENTITY_SIMPLIFIED.simplify()
+
+
+def bench_exp_log_identity_cold():
+    """Benchmark exp(log(x)) identity (fresh symbol each call)."""
+    return exp(log(_fresh_symbol())).simplify()
+
+
+def bench_exp_log_identity_built():
+    """Benchmark exp(log(x)) identity (single build_expr call)."""
+    return build_expr(_EXP_LOG_IDENTITY_SPEC).simplify()
+
+
+def bench_exp_log_identity_parse_only():
+    """Benchmark exp(log(x)) identity (parse only)."""
+    return parse("exp(log(x))")
+
+
+def bench_exp_log_identity_simplify_cached_parse():
+    """Benchmark exp(log(x)) identity (simplify of cached parse)."""
+    return _EXP_LOG_IDENTITY_PARSED.simplify()
 
 
 def bench_nested_exp_direct():
     """Benchmark nested exp (direct API): exp(exp(x))."""
-    x = symbol('x')
+    x = _X
     expr = exp(exp(x))
     result = expr.simplify()
     return result
 
 
-def bench_nested_exp_with_parsing():
-    """Benchmark nested exp (with parsing): exp(exp(x))."""
-    expr = parse("exp(exp(x))")
-    result = expr.simplify()
-    return result
+def bench_nested_exp_built():
+    """Benchmark nested exp (single build_expr call): exp(exp(x))."""
+    return build_expr(_NESTED_EXP_SPEC).simplify()
+
+
+def bench_nested_exp_parse_only():
+    """Benchmark nested exp (parse only): exp(exp(x))."""
+    return parse("exp(exp(x))")
+
+
+def bench_nested_exp_simplify_cached_parse():
+    """Benchmark nested exp (simplify of cached parse): exp(exp(x))."""
+    return _NESTED_EXP_PARSED.simplify()
 
 
 # ============================================================================
@@ -254,32 +360,48 @@ def bench_nested_exp_with_parsing():
 
 def bench_sqrt_symbolic_direct():
     """Benchmark sqrt symbolic (direct API): sqrt(x)."""
-    x = symbol('x')
+    x = _X
     expr = sqrt(x)
     result = expr.simplify()
     return result
 
 
-def bench_sqrt_symbolic_with_parsing():
-    """Benchmark sqrt symbolic (with parsing): sqrt(x)."""
-    expr = parse("sqrt(x)")
-    result = expr.simplify()
-    return result
+def bench_sqrt_symbolic_parse_only():
+    """Benchmark sqrt symbolic (parse only): sqrt(x)."""
+    return parse("sqrt(x)")
+
+
+def bench_sqrt_symbolic_simplify_cached_parse():
+    """Benchmark sqrt symbolic (simplify of cached parse): sqrt(x)."""
+    return _SQRT_SYMBOLIC_PARSED.simplify()
 
 
 def bench_sqrt_square_direct():
     """Benchmark sqrt(x^2) simplification (direct API)."""
-    x = symbol('x')
+    x = _X
     expr = sqrt(x ** 2)
     result = expr.simplify()
     return result
 
 
-def bench_sqrt_square_with_parsing():
-    """Benchmark sqrt(x^2) simplification (with parsing)."""
-    expr = parse("sqrt(x^2)")
-    result = expr.simplify()
-    return result
+def bench_sqrt_square_presimplified():
+    """Benchmark sqrt(x^2) simplification (already simplified)."""
+    return _SQRT_SQUARE_SIMPLIFIED.simplify()
+
+
+def bench_sqrt_square_cold():
+    """Benchmark sqrt(x^2) simplification (fresh symbol each call)."""
+    return sqrt(_fresh_symbol() ** 2).simplify()
+
+
+def bench_sqrt_square_parse_only():
+    """Benchmark sqrt(x^2) simplification (parse only)."""
+    return parse("sqrt(x^2)")
+
+
+def bench_sqrt_square_simplify_cached_parse():
+    """Benchmark sqrt(x^2) simplification (simplify of cached parse)."""
+    return _SQRT_SQUARE_PARSED.simplify()
 
 
 # ============================================================================
@@ -288,32 +410,38 @@ def bench_sqrt_square_with_parsing():
 
 def bench_abs_symbolic_direct():
     """Benchmark abs symbolic (direct API): abs(x)."""
-    x = symbol('x')
+    x = _X
     expr = abs_expr(x)
     result = expr.simplify()
     return result
 
 
-def bench_abs_symbolic_with_parsing():
-    """Benchmark abs symbolic (with parsing): abs(x)."""
-    expr = parse("abs(x)")
-    result = expr.simplify()
-    return result
+def bench_abs_symbolic_parse_only():
+    """Benchmark abs symbolic (parse only): abs(x)."""
+    return parse("abs(x)")
+
+
+def bench_abs_symbolic_simplify_cached_parse():
+    """Benchmark abs symbolic (simplify of cached parse): abs(x)."""
+    return _ABS_SYMBOLIC_PARSED.simplify()
 
 
 def bench_nested_abs_direct():
     """Benchmark nested abs (direct API): abs(abs(x))."""
-    x = symbol('x')
+    x = _X
     expr = abs_expr(abs_expr(x))
     result = expr.simplify()
     return result
 
 
-def bench_nested_abs_with_parsing():
-    """Benchmark nested abs (with parsing): abs(abs(x))."""
-    expr = parse("abs(abs(x))")
-    result = expr.simplify()
-    return result
+def bench_nested_abs_parse_only():
+    """Benchmark nested abs (parse only): abs(abs(x))."""
+    return parse("abs(abs(x))")
+
+
+def bench_nested_abs_simplify_cached_parse():
+    """Benchmark nested abs (simplify of cached parse): abs(abs(x))."""
+    return _NESTED_ABS_PARSED.simplify()
 
 
 # ============================================================================
@@ -326,11 +454,14 @@ def bench_factorial_small_direct():
     return result
 
 
-def bench_factorial_small_with_parsing():
-    """Benchmark factorial of small number (with parsing): factorial(5)."""
-    expr = parse("factorial(5)")
-    result = expr.simplify()
-    return result
+def bench_factorial_small_parse_only():
+    """Benchmark factorial of small number (parse only): factorial(5)."""
+    return parse("factorial(5)")
+
+
+def bench_factorial_small_simplify_cached_parse():
+    """Benchmark factorial of small number (simplify of cached parse): factorial(5)."""
+    return _FACTORIAL_SMALL_PARSED.simplify()
 
 
 def bench_gamma_symbolic_direct():
@@ -339,11 +470,14 @@ def bench_gamma_symbolic_direct():
     return result
 
 
-def bench_gamma_symbolic_with_parsing():
-    """Benchmark gamma symbolic (with parsing): gamma(5)."""
-    expr = parse("gamma(5)")
-    result = expr.simplify()
-    return result
+def bench_gamma_symbolic_parse_only():
+    """Benchmark gamma symbolic (parse only): gamma(5)."""
+    return parse("gamma(5)")
+
+
+def bench_gamma_symbolic_simplify_cached_parse():
+    """Benchmark gamma symbolic (simplify of cached parse): gamma(5)."""
+    return _GAMMA_SYMBOLIC_PARSED.simplify()
 
 
 # ============================================================================
@@ -352,47 +486,60 @@ def bench_gamma_symbolic_with_parsing():
 
 def bench_sin_exp_direct():
     """Benchmark sin(exp(x)) composition (direct API)."""
-    x = symbol('x')
+    x = _X
     expr = sin(exp(x))
     result = expr.simplify()
     return result
 
 
-def bench_sin_exp_with_parsing():
-    """Benchmark sin(exp(x)) composition (with parsing)."""
-    expr = parse("sin(exp(x))")
-    result = expr.simplify()
-    return result
+def bench_sin_exp_parse_only():
+    """Benchmark sin(exp(x)) composition (parse only)."""
+    return parse("sin(exp(x))")
+
+
+def bench_sin_exp_simplify_cached_parse():
+    """Benchmark sin(exp(x)) composition (simplify of cached parse)."""
+    return _SIN_EXP_PARSED.simplify()
 
 
 def bench_log_trig_sum_direct():
     """Benchmark log(sin(x) + cos(x)) (direct API)."""
-    x = symbol('x')
-    expr = log(sin(x) + cos(x))
+    expr = log(_SIN_X + _COS_X)
     result = expr.simplify()
     return result
 
 
-def bench_log_trig_sum_with_parsing():
-    """Benchmark log(sin(x) + cos(x)) (with parsing)."""
-    expr = parse("log(sin(x) + cos(x))")
-    result = expr.simplify()
-    return result
+def bench_log_trig_sum_parse_only():
+    """Benchmark log(sin(x) + cos(x)) (parse only)."""
+    return parse("log(sin(x) + cos(x))")
+
+
+def bench_log_trig_sum_simplify_cached_parse():
+    """Benchmark log(sin(x) + cos(x)) (simplify of cached parse)."""
+    return _LOG_TRIG_SUM_PARSED.simplify()
 
 
 def bench_deeply_nested_direct():
     """Benchmark deeply nested functions (direct API): sin(cos(exp(log(x))))."""
-    x = symbol('x')
+    x = _X
     expr = sin(cos(exp(log(x))))
     result = expr.simplify()
     return result
 
 
-def bench_deeply_nested_with_parsing():
-    """Benchmark deeply nested functions (with parsing): sin(cos(exp(log(x))))."""
-    expr = parse("sin(cos(exp(log(x))))")
-    result = expr.simplify()
-    return result
+def bench_deeply_nested_built():
+    """Benchmark deeply nested functions (single build_expr call): sin(cos(exp(log(x))))."""
+    return build_expr(_DEEPLY_NESTED_SPEC).simplify()
+
+
+def bench_deeply_nested_parse_only():
+    """Benchmark deeply nested functions (parse only): sin(cos(exp(log(x))))."""
+    return parse("sin(cos(exp(log(x))))")
+
+
+def bench_deeply_nested_simplify_cached_parse():
+    """Benchmark deeply nested functions (simplify of cached parse): sin(cos(exp(log(x))))."""
+    return _DEEPLY_NESTED_PARSED.simplify()
 
 
 # ============================================================================
@@ -400,115 +547,96 @@ def bench_deeply_nested_with_parsing():
 # ============================================================================
 
 def bench_pythagorean_identity_direct():
-    """Benchmark Pythagorean identity (direct API): sin^2(x) + cos^2(x)."""
-    x = symbol('x')
-    expr = sin(x)**2 + cos(x)**2
-    result = expr.simplify()
-    return result
+    """Benchmark Pythagorean identity (direct API, prebuilt tree): sin^2(x) + cos^2(x)."""
+    return _PYTHAGOREAN_IDENTITY.simplify()
 
 
-def bench_pythagorean_identity_with_parsing():
-    """Benchmark Pythagorean identity (with parsing): sin^2(x) + cos^2(x)."""
-    expr = parse("sin(x)^2 + cos(x)^2")
-    result = expr.simplify()
-    return result
+def bench_pythagorean_identity_cold():
+    """Benchmark Pythagorean identity (fresh symbol each call): sin^2(x_n) + cos^2(x_n)."""
+    x = _fresh_symbol()
+    return (sin(x)**2 + cos(x)**2).simplify()
+
+
+def bench_pythagorean_identity_construction():
+    """Benchmark building sin^2(x) + cos^2(x) from sin(x), cos(x) (no simplify)."""
+    return _SIN_X**2 + _COS_X**2
+
+
+def bench_pythagorean_identity_presimplified():
+    """Benchmark Pythagorean identity (already simplified): sin^2(x) + cos^2(x)."""
+    return _PYTHAGOREAN_IDENTITY_SIMPLIFIED.simplify()
+
+
+def bench_pythagorean_identity_parse_only():
+    """Benchmark Pythagorean identity (parse only): sin^2(x) + cos^2(x)."""
+    return parse("sin(x)^2 + cos(x)^2")
+
+
+def bench_pythagorean_identity_simplify_cached_parse():
+    """Benchmark Pythagorean identity (simplify of cached parse): sin^2(x) + cos^2(x)."""
+    return _PYTHAGOREAN_IDENTITY_PARSED.simplify()
 
 
 def bench_double_angle_direct():
     """Benchmark double angle (direct API): 2*sin(x)*cos(x)."""
-    x = symbol('x')
-    expr = 2 * sin(x) * cos(x)
+    expr = 2 * _SIN_X * _COS_X
     result = expr.simplify()
     return result
 
 
-def bench_double_angle_with_parsing():
-    """Benchmark double angle (with parsing): 2*sin(x)*cos(x)."""
-    expr = parse("2 * sin(x) * cos(x)")
-    result = expr.simplify()
-    return result
+def bench_double_angle_parse_only():
+    """Benchmark double angle (parse only): 2*sin(x)*cos(x)."""
+    return parse("2 * sin(x) * cos(x)")
+
+
+def bench_double_angle_simplify_cached_parse():
+    """Benchmark double angle (simplify of cached parse): 2*sin(x)*cos(x)."""
+    return _DOUBLE_ANGLE_PARSED.simplify()
+
+
+# ============================================================================
+# Batch Parsing Benchmarks
+# ============================================================================
+
+def bench_all_inputs_batch_parse_only():
+    """Benchmark parsing every cached-parse input in one parse_batch call."""
+    return parse_batch(_PARSE_STRINGS)
 
 
 # ============================================================================
 # Benchmark Runner
 # ============================================================================
 
+_PARSER_WARMUP = 100
+_BENCH_WARMUP = 2
+
+# Every bench_* function in definition order, collected once at import. The
+# parse-only benches go last so they run back to back on a warm parser.
+_ALL_BENCHES = tuple(sorted(
+    ((name, func) for name, func in globals().items()
+     if name.startswith("bench_") and callable(func)),
+    key=lambda item: item[0].endswith("_parse_only"),
+))
+
+
 def run_all_benchmarks(samples: int = 100) -> Dict[str, BenchmarkResult]:
     """Run all function evaluation benchmarks."""
     results = {}
 
-    benchmarks = [
-        # Elementary trigonometric
-        bench_sin_symbolic_direct,
-        bench_sin_symbolic_with_parsing,
-        bench_cos_symbolic_direct,
-        bench_cos_symbolic_with_parsing,
-        bench_tan_symbolic_direct,
-        bench_tan_symbolic_with_parsing,
-        bench_nested_trig_direct,
-        bench_nested_trig_with_parsing,
-        bench_arcsin_symbolic_direct,
-        bench_arcsin_symbolic_with_parsing,
-
-        # Hyperbolic functions
-        bench_sinh_symbolic_direct,
-        bench_sinh_symbolic_with_parsing,
-        bench_cosh_symbolic_direct,
-        bench_cosh_symbolic_with_parsing,
-        bench_tanh_symbolic_direct,
-        bench_tanh_symbolic_with_parsing,
-
-        # Exponential and logarithmic
-        bench_exp_symbolic_direct,
-        bench_exp_symbolic_with_parsing,
-        bench_log_symbolic_direct,
-        bench_log_symbolic_with_parsing,
-        bench_exp_log_identity_direct,
-        bench_exp_log_identity_with_parsing,
-        bench_nested_exp_direct,
-        bench_nested_exp_with_parsing,
-
-        # Power and root
-        bench_sqrt_symbolic_direct,
-        bench_sqrt_symbolic_with_parsing,
-        bench_sqrt_square_direct,
-        bench_sqrt_square_with_parsing,
-
-        # Absolute value
-        bench_abs_symbolic_direct,
-        bench_abs_symbolic_with_parsing,
-        bench_nested_abs_direct,
-        bench_nested_abs_with_parsing,
-
-        # Factorial and special functions
-        bench_factorial_small_direct,
-        bench_factorial_small_with_parsing,
-        bench_gamma_symbolic_direct,
-        bench_gamma_symbolic_with_parsing,
-
-        # Function composition
-        bench_sin_exp_direct,
-        bench_sin_exp_with_parsing,
-        bench_log_trig_sum_direct,
-        bench_log_trig_sum_with_parsing,
-        bench_deeply_nested_direct,
-        bench_deeply_nested_with_parsing,
-
-        # Trigonometric identities
-        bench_pythagorean_identity_direct,
-        bench_pythagorean_identity_with_parsing,
-        bench_double_angle_direct,
-        bench_double_angle_with_parsing,
-    ]
-
     print("=" * 80)
     print("Function Evaluation Benchmarks")
     print("=" * 80)
 
-    for bench_func in benchmarks:
-        print(f"Running {bench_func.__name__}...", end=" ")
-        result = benchmark(bench_func, samples=samples)
-        results[bench_func.__name__] = result
+    # Warm the parser and the simplifier once up front (every cached input
+    # through one simplify_many call); each bench then needs only a short warmup
+    for _ in range(_PARSER_WARMUP):
+        parse("sin(cos(exp(log(x))))")
+    simplify_many(_PARSED_INPUTS)
+
+    for name, bench_func in _ALL_BENCHES:
+        print(f"Running {name}...", end=" ")
+        result = benchmark(bench_func, samples=samples, warmup=_BENCH_WARMUP)
+        results[name] = result
         print(f"{result.mean_ns:.2f}ns")
 
     print("=" * 80)
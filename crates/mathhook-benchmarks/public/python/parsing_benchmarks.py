@@ -7,48 +7,23 @@ Tests: Simple/complex parsing, implicit multiplication, formatting
 Last Updated: 2025-12-28T1200
 """
 
-import time
-import statistics
-from typing import Dict, List
+import sys
+from typing import Dict
+
+from _bench_harness import PYPERF_FLAG, BenchmarkResult, benchmark, run_pyperf
 
 try:
-    from mathhook import symbol, symbols, parse, sin, cos
+    from mathhook import symbol, symbols, parse, parse_batch, parse_bytes, sin, cos
 except ImportError:
     print("ERROR: mathhook Python bindings not found. Install with: pip install mathhook")
     exit(1)
 
 
-class BenchmarkResult:
-    """Stores benchmark timing results."""
-
-    def __init__(self, name: str, times_ns: List[int]):
-        self.name = name
-        self.times_ns = times_ns
-        self.mean_ns = statistics.mean(times_ns)
-        self.median_ns = statistics.median(times_ns)
-        self.min_ns = min(times_ns)
-        self.max_ns = max(times_ns)
-        self.std_dev_ns = statistics.stdev(times_ns) if len(times_ns) > 1 else 0.0
-        self.samples = len(times_ns)
-
-    def __repr__(self):
-        return (f"{self.name}: {self.mean_ns:.2f}ns ± {self.std_dev_ns:.2f}ns "
-                f"(median: {self.median_ns:.2f}ns)")
-
-
-def benchmark(func, samples: int = 100, warmup: int = 10) -> BenchmarkResult:
-    """Benchmark a function with warmup and multiple samples."""
-    for _ in range(warmup):
-        func()
-
-    times_ns = []
-    for _ in range(samples):
-        start = time.perf_counter_ns()
-        func()
-        end = time.perf_counter_ns()
-        times_ns.append(end - start)
+# ============================================================================
+# Shared Symbols
+# ============================================================================
 
-    return BenchmarkResult(func.__name__, times_ns)
+_X = symbol('x')
 
 
 # ============================================================================
@@ -147,81 +122,217 @@ def bench_parse_sin_x_cos_x():
     return result
 
 
+# ============================================================================
+# Bytes Input Parsing Benchmarks (parse_bytes on pre-encoded input, paired
+# with the str benches above)
+# ============================================================================
+
+def bench_parse_variable_bytes():
+    """Benchmark parsing a variable from bytes: x."""
+    return parse_bytes(b"x")
+
+
+def bench_parse_polynomial_bytes():
+    """Benchmark parsing polynomial from bytes: x^3 + 2*x^2 - 5*x + 3."""
+    return parse_bytes(b"x^3 + 2*x^2 - 5*x + 3")
+
+
+def bench_parse_trig_identity_bytes():
+    """Benchmark parsing trig identity from bytes: sin(x)^2 + cos(x)^2."""
+    return parse_bytes(b"sin(x)^2 + cos(x)^2")
+
+
 # ============================================================================
 # Formatting Benchmarks
 # ============================================================================
 
-def bench_format_simple():
+def _setup_format_simple():
+    return _X + 1
+
+
+def bench_format_simple(expr):
     """Benchmark formatting simple expression: x + 1."""
-    x = symbol('x')
-    expr = x + 1
-    result = str(expr)
-    return result
+    return str(expr)
 
 
-def bench_format_polynomial():
+def _setup_format_polynomial():
+    return _X**3 + 2*_X**2 + _X
+
+
+def bench_format_polynomial(expr):
     """Benchmark formatting polynomial: x^3 + 2*x^2 + x."""
-    x = symbol('x')
-    expr = x**3 + 2*x**2 + x
-    result = str(expr)
-    return result
+    return str(expr)
 
 
-def bench_format_nested_functions():
+def _setup_format_nested_functions():
+    return sin(cos(_X))
+
+
+def bench_format_nested_functions(expr):
     """Benchmark formatting nested functions: sin(cos(x))."""
-    x = symbol('x')
-    expr = sin(cos(x))
-    result = str(expr)
-    return result
+    return str(expr)
 
 
-def bench_format_latex_simple():
+def _setup_format_latex_simple():
+    return _X + 1
+
+
+def bench_format_latex_simple(expr):
     """Benchmark LaTeX formatting simple expression: x + 1."""
-    x = symbol('x')
-    expr = x + 1
-    result = expr.to_latex()
-    return result
+    return expr.to_latex()
+
 
+def _setup_format_latex_polynomial():
+    return _X**3 + 2*_X**2 + _X
 
-def bench_format_latex_polynomial():
+
+def bench_format_latex_polynomial(expr):
     """Benchmark LaTeX formatting polynomial: x^3 + 2*x^2 + x."""
-    x = symbol('x')
-    expr = x**3 + 2*x**2 + x
-    result = expr.to_latex()
-    return result
+    return expr.to_latex()
+
 
+def _setup_format_latex_nested():
+    return sin(cos(_X))
 
-def bench_format_latex_nested():
+
+def bench_format_latex_nested(expr):
     """Benchmark LaTeX formatting nested functions: sin(cos(x))."""
-    x = symbol('x')
-    expr = sin(cos(x))
-    result = expr.to_latex()
-    return result
+    return expr.to_latex()
 
 
 # ============================================================================
 # Parsing Throughput Benchmarks
 # ============================================================================
 
+def _flat_sum(n: int) -> str:
+    """x0 + x1 + ... + x{n-1} as a flat (left-deep) sum."""
+    return " + ".join([f"x{i}" for i in range(n)])
+
+
+def _balanced_sum(n: int) -> str:
+    """x0 + ... + x{n-1} parenthesized pairwise, nesting depth ceil(log2(n))."""
+    terms = [f"x{i}" for i in range(n)]
+    while len(terms) > 1:
+        pairs = [f"({a} + {b})" for a, b in zip(terms[::2], terms[1::2])]
+        terms = pairs + terms[2 * len(pairs):]
+    return terms[0]
+
+
+# Inputs of the throughput benches, joined once at import
+_SUM_10 = _flat_sum(10)
+_SUM_10_BALANCED = _balanced_sum(10)
+_SUM_20 = _flat_sum(20)
+_SUM_20_BALANCED = _balanced_sum(20)
+_SUM_50 = _flat_sum(50)
+_SUM_50_BYTES = _SUM_50.encode()
+_SUM_50_BALANCED = _balanced_sum(50)
+
+# 100 varied inputs (sums of 1..100 terms) for the one-at-a-time vs batch pair
+_SUM_BATCH = [_flat_sum(n) for n in range(1, 101)]
+
+
 def bench_parse_sum_10_terms():
     """Benchmark parsing sum with 10 terms."""
-    expr_str = " + ".join([f"x{i}" for i in range(10)])
-    result = parse(expr_str)
-    return result
+    return parse(_SUM_10)
+
+
+def bench_parse_sum_10_terms_balanced():
+    """Benchmark parsing the 10-term sum as a balanced parenthesized tree."""
+    return parse(_SUM_10_BALANCED)
 
 
 def bench_parse_sum_20_terms():
     """Benchmark parsing sum with 20 terms."""
-    expr_str = " + ".join([f"x{i}" for i in range(20)])
-    result = parse(expr_str)
-    return result
+    return parse(_SUM_20)
+
+
+def bench_parse_sum_20_terms_balanced():
+    """Benchmark parsing the 20-term sum as a balanced parenthesized tree."""
+    return parse(_SUM_20_BALANCED)
 
 
 def bench_parse_sum_50_terms():
     """Benchmark parsing sum with 50 terms."""
-    expr_str = " + ".join([f"x{i}" for i in range(50)])
-    result = parse(expr_str)
-    return result
+    return parse(_SUM_50)
+
+
+def bench_parse_sum_50_terms_bytes():
+    """Benchmark parsing the 50-term sum from pre-encoded bytes."""
+    return parse_bytes(_SUM_50_BYTES)
+
+
+def bench_parse_sum_50_terms_balanced():
+    """Benchmark parsing the 50-term sum as a balanced parenthesized tree."""
+    return parse(_SUM_50_BALANCED)
+
+
+def bench_parse_100_sums_loop():
+    """Benchmark parsing 100 sums of 1..100 terms with one parse() call each."""
+    return [parse(s) for s in _SUM_BATCH]
+
+
+def bench_parse_100_sums_batch():
+    """Benchmark parsing the same 100 sums with a single parse_batch() call."""
+    return parse_batch(_SUM_BATCH)
+
+
+# Untimed input builders for the benches that take their subject as an argument
+_SETUPS = {
+    bench_format_simple: _setup_format_simple,
+    bench_format_polynomial: _setup_format_polynomial,
+    bench_format_nested_functions: _setup_format_nested_functions,
+    bench_format_latex_simple: _setup_format_latex_simple,
+    bench_format_latex_polynomial: _setup_format_latex_polynomial,
+    bench_format_latex_nested: _setup_format_latex_nested,
+}
+
+
+# Run order for run_all_benchmarks() and the --pyperf mode
+_BENCHMARKS = (
+    # Simple parsing
+    bench_parse_variable,
+    bench_parse_number,
+    bench_parse_addition,
+    bench_parse_multiplication,
+    bench_parse_power,
+    bench_parse_sin,
+
+    # Complex parsing
+    bench_parse_polynomial,
+    bench_parse_nested_functions,
+    bench_parse_complex_fraction,
+    bench_parse_trig_identity,
+
+    # Implicit multiplication
+    bench_parse_2x,
+    bench_parse_2_paren_x_plus_1,
+    bench_parse_paren_a_paren_b,
+    bench_parse_sin_x_cos_x,
+
+    # Bytes input
+    bench_parse_variable_bytes,
+    bench_parse_polynomial_bytes,
+    bench_parse_trig_identity_bytes,
+
+    # Formatting
+    bench_format_simple,
+    bench_format_polynomial,
+    bench_format_nested_functions,
+    bench_format_latex_simple,
+    bench_format_latex_polynomial,
+    bench_format_latex_nested,
+
+    # Throughput
+    bench_parse_sum_10_terms,
+    bench_parse_sum_10_terms_balanced,
+    bench_parse_sum_20_terms,
+    bench_parse_sum_20_terms_balanced,
+    bench_parse_sum_50_terms,
+    bench_parse_sum_50_terms_bytes,
+    bench_parse_sum_50_terms_balanced,
+    bench_parse_100_sums_loop,
+    bench_parse_100_sums_batch,
+)
 
 
 # ============================================================================
@@ -232,48 +343,13 @@ def run_all_benchmarks(samples: int = 100) -> Dict[str, BenchmarkResult]:
     """Run all parsing benchmarks."""
     results = {}
 
-    benchmarks = [
-        # Simple parsing
-        bench_parse_variable,
-        bench_parse_number,
-        bench_parse_addition,
-        bench_parse_multiplication,
-        bench_parse_power,
-        bench_parse_sin,
-
-        # Complex parsing
-        bench_parse_polynomial,
-        bench_parse_nested_functions,
-        bench_parse_complex_fraction,
-        bench_parse_trig_identity,
-
-        # Implicit multiplication
-        bench_parse_2x,
-        bench_parse_2_paren_x_plus_1,
-        bench_parse_paren_a_paren_b,
-        bench_parse_sin_x_cos_x,
-
-        # Formatting
-        bench_format_simple,
-        bench_format_polynomial,
-        bench_format_nested_functions,
-        bench_format_latex_simple,
-        bench_format_latex_polynomial,
-        bench_format_latex_nested,
-
-        # Throughput
-        bench_parse_sum_10_terms,
-        bench_parse_sum_20_terms,
-        bench_parse_sum_50_terms,
-    ]
-
     print("=" * 80)
     print("Parsing Benchmarks")
     print("=" * 80)
 
-    for bench_func in benchmarks:
+    for bench_func in _BENCHMARKS:
         print(f"Running {bench_func.__name__}...", end=" ")
-        result = benchmark(bench_func, samples=samples)
+        result = benchmark(bench_func, samples=samples, setup=_SETUPS.get(bench_func))
         results[bench_func.__name__] = result
         print(f"{result.mean_ns:.2f}ns")
 
@@ -284,6 +360,10 @@ def run_all_benchmarks(samples: int = 100) -> Dict[str, BenchmarkResult]:
 
 def main():
     """Main entry point for parsing benchmarks."""
+    if PYPERF_FLAG in sys.argv:
+        run_pyperf(_BENCHMARKS, _SETUPS)
+        return
+
     results = run_all_benchmarks(samples=100)
 
     print("\nDetailed Results:")
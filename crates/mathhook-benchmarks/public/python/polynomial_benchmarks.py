@@ -7,61 +7,59 @@ Tests: GCD, division, factorization, special polynomials
 Last Updated: 2025-12-28T1200
 """
 
-import time
-import statistics
-from typing import Dict, List
+import sys
+from typing import Dict
+
+from _bench_harness import PYPERF_FLAG, BenchmarkResult, benchmark, run_pyperf
 
 try:
-    from mathhook import symbol, symbols, parse, gcd
+    from mathhook import symbol, parse, parse_and_simplify, gcd
 except ImportError:
     print("ERROR: mathhook Python bindings not found. Install with: pip install mathhook")
     exit(1)
 
 
-class BenchmarkResult:
-    """Stores benchmark timing results."""
-
-    def __init__(self, name: str, times_ns: List[int]):
-        self.name = name
-        self.times_ns = times_ns
-        self.mean_ns = statistics.mean(times_ns)
-        self.median_ns = statistics.median(times_ns)
-        self.min_ns = min(times_ns)
-        self.max_ns = max(times_ns)
-        self.std_dev_ns = statistics.stdev(times_ns) if len(times_ns) > 1 else 0.0
-        self.samples = len(times_ns)
-
-    def __repr__(self):
-        return (f"{self.name}: {self.mean_ns:.2f}ns +/- {self.std_dev_ns:.2f}ns "
-                f"(median: {self.median_ns:.2f}ns)")
+# ============================================================================
+# Shared Symbols
+# ============================================================================
 
+_X = symbol('x')
+_Y = symbol('y')
 
-def benchmark(func, samples: int = 100, warmup: int = 10) -> BenchmarkResult:
-    """Benchmark a function with warmup and multiple samples."""
-    for _ in range(warmup):
-        func()
 
-    times_ns = []
-    for _ in range(samples):
-        start = time.perf_counter_ns()
-        func()
-        end = time.perf_counter_ns()
-        times_ns.append(end - start)
+# ============================================================================
+# Pre-parsed Expressions (inputs of the *_cached_parse benches)
+# ============================================================================
 
-    return BenchmarkResult(func.__name__, times_ns)
+_poly_gcd_univariate_simple_f = parse("x^2 - 1")
+_poly_gcd_univariate_simple_g = parse("x - 1")
+_poly_gcd_univariate_degree_10_f = parse("x^10 + 10*x^9 + 9*x^8 + 8*x^7 + 7*x^6 + 6*x^5 + 5*x^4 + 4*x^3 + 3*x^2 + 2*x - 1")
+_poly_gcd_univariate_degree_10_g = parse("x^5 - 1")
+_poly_gcd_bivariate_simple_f = parse("x * y")
+_poly_gcd_bivariate_simple_g = parse("x * (y + 1)")
+_poly_division_simple_expr = parse("(x^2 - 1) / (x - 1)")
+_poly_division_degree_8_expr = parse("(x^8 - 1) / (x^2 - 1)")
+_poly_factor_quadratic_expr = parse("x^2 - 1")
+_poly_factor_cubic_expr = parse("x^3 - 1")
+_poly_common_factor_extraction_expr = parse("6*x^2 + 12*x + 18")
+_poly_multiply_small_expr = parse("(x + 1) * (x + 2)")
+_poly_multiply_medium_expr = parse("(x^2 + x + 1) * (x^2 - 1)")
+_poly_multiply_large_expr = parse("(x^4 + x^3 + x^2 + x + 1) * (x^4 - x^3 + x^2 - x + 1)")
+_poly_binomial_expansion_degree_3_expr = parse("(x + 1)^3")
+_poly_binomial_expansion_degree_5_expr = parse("(x + 1)^5")
 
 
 # ============================================================================
 # GCD Algorithm Benchmarks
 # ============================================================================
 
+_GCD_UNIVARIATE_SIMPLE_F = _X**2 - 1
+_GCD_UNIVARIATE_SIMPLE_G = _X - 1
+
+
 def bench_gcd_univariate_simple_direct():
     """Benchmark univariate GCD simple (direct API): gcd(x^2-1, x-1)."""
-    x = symbol('x')
-    f = x**2 - 1
-    g = x - 1
-    result = gcd(f, g)
-    return result
+    return gcd(_GCD_UNIVARIATE_SIMPLE_F, _GCD_UNIVARIATE_SIMPLE_G)
 
 
 def bench_gcd_univariate_simple_with_parsing():
@@ -72,14 +70,19 @@ def bench_gcd_univariate_simple_with_parsing():
     return result
 
 
+def bench_gcd_univariate_simple_cached_parse():
+    """Benchmark univariate GCD simple (cached parse): gcd(x^2-1, x-1)."""
+    return gcd(_poly_gcd_univariate_simple_f, _poly_gcd_univariate_simple_g)
+
+
+_GCD_UNIVARIATE_DEGREE_10_F = (_X**10 + 10*_X**9 + 9*_X**8 + 8*_X**7 + 7*_X**6 +
+                               6*_X**5 + 5*_X**4 + 4*_X**3 + 3*_X**2 + 2*_X - 1)
+_GCD_UNIVARIATE_DEGREE_10_G = _X**5 - 1
+
+
 def bench_gcd_univariate_degree_10_direct():
     """Benchmark univariate GCD degree 10 (direct API)."""
-    x = symbol('x')
-    f = (x**10 + 10*x**9 + 9*x**8 + 8*x**7 + 7*x**6 +
-         6*x**5 + 5*x**4 + 4*x**3 + 3*x**2 + 2*x - 1)
-    g = x**5 - 1
-    result = gcd(f, g)
-    return result
+    return gcd(_GCD_UNIVARIATE_DEGREE_10_F, _GCD_UNIVARIATE_DEGREE_10_G)
 
 
 def bench_gcd_univariate_degree_10_with_parsing():
@@ -90,13 +93,18 @@ def bench_gcd_univariate_degree_10_with_parsing():
     return result
 
 
+def bench_gcd_univariate_degree_10_cached_parse():
+    """Benchmark univariate GCD degree 10 (cached parse)."""
+    return gcd(_poly_gcd_univariate_degree_10_f, _poly_gcd_univariate_degree_10_g)
+
+
+_GCD_BIVARIATE_SIMPLE_F = _X * _Y
+_GCD_BIVARIATE_SIMPLE_G = _X * (_Y + 1)
+
+
 def bench_gcd_bivariate_simple_direct():
     """Benchmark bivariate GCD simple (direct API): gcd(x*y, x*(y+1))."""
-    x, y = symbols('x y')
-    f = x * y
-    g = x * (y + 1)
-    result = gcd(f, g)
-    return result
+    return gcd(_GCD_BIVARIATE_SIMPLE_F, _GCD_BIVARIATE_SIMPLE_G)
 
 
 def bench_gcd_bivariate_simple_with_parsing():
@@ -107,52 +115,63 @@ def bench_gcd_bivariate_simple_with_parsing():
     return result
 
 
+def bench_gcd_bivariate_simple_cached_parse():
+    """Benchmark bivariate GCD simple (cached parse): gcd(x*y, x*(y+1))."""
+    return gcd(_poly_gcd_bivariate_simple_f, _poly_gcd_bivariate_simple_g)
+
+
 # ============================================================================
 # Polynomial Division Benchmarks
 # ============================================================================
 
+_DIVISION_SIMPLE_DIVIDEND = _X**2 - 1
+_DIVISION_SIMPLE_DIVISOR = _X - 1
+
+
 def bench_division_simple_direct():
     """Benchmark simple division (direct API): (x^2-1)/(x-1)."""
-    x = symbol('x')
-    dividend = x**2 - 1
-    divisor = x - 1
-    result = dividend / divisor
-    return result
+    return _DIVISION_SIMPLE_DIVIDEND / _DIVISION_SIMPLE_DIVISOR
 
 
 def bench_division_simple_with_parsing():
     """Benchmark simple division (with parsing): (x^2-1)/(x-1)."""
-    expr = parse("(x^2 - 1) / (x - 1)")
-    result = expr.simplify()
-    return result
+    return parse_and_simplify("(x^2 - 1) / (x - 1)")
+
+
+def bench_division_simple_cached_parse():
+    """Benchmark simple division (cached parse): (x^2-1)/(x-1)."""
+    return _poly_division_simple_expr.simplify()
+
+
+_DIVISION_DEGREE_8_DIVIDEND = _X**8 - 1
+_DIVISION_DEGREE_8_DIVISOR = _X**2 - 1
 
 
 def bench_division_degree_8_direct():
     """Benchmark higher degree division (direct API): (x^8-1)/(x^2-1)."""
-    x = symbol('x')
-    dividend = x**8 - 1
-    divisor = x**2 - 1
-    result = dividend / divisor
-    return result
+    return _DIVISION_DEGREE_8_DIVIDEND / _DIVISION_DEGREE_8_DIVISOR
 
 
 def bench_division_degree_8_with_parsing():
     """Benchmark higher degree division (with parsing): (x^8-1)/(x^2-1)."""
-    expr = parse("(x^8 - 1) / (x^2 - 1)")
-    result = expr.simplify()
-    return result
+    return parse_and_simplify("(x^8 - 1) / (x^2 - 1)")
+
+
+def bench_division_degree_8_cached_parse():
+    """Benchmark higher degree division (cached parse): (x^8-1)/(x^2-1)."""
+    return _poly_division_degree_8_expr.simplify()
 
 
 # ============================================================================
 # Factorization Benchmarks
 # ============================================================================
 
+_FACTOR_QUADRATIC = _X**2 - 1
+
+
 def bench_factor_quadratic_direct():
     """Benchmark factor quadratic (direct API): factor(x^2-1)."""
-    x = symbol('x')
-    poly = x**2 - 1
-    result = poly.factor()
-    return result
+    return _FACTOR_QUADRATIC.factor()
 
 
 def bench_factor_quadratic_with_parsing():
@@ -162,12 +181,17 @@ def bench_factor_quadratic_with_parsing():
     return result
 
 
+def bench_factor_quadratic_cached_parse():
+    """Benchmark factor quadratic (cached parse): factor(x^2-1)."""
+    return _poly_factor_quadratic_expr.factor()
+
+
+_FACTOR_CUBIC = _X**3 - 1
+
+
 def bench_factor_cubic_direct():
     """Benchmark factor cubic (direct API): factor(x^3-1)."""
-    x = symbol('x')
-    poly = x**3 - 1
-    result = poly.factor()
-    return result
+    return _FACTOR_CUBIC.factor()
 
 
 def bench_factor_cubic_with_parsing():
@@ -177,12 +201,17 @@ def bench_factor_cubic_with_parsing():
     return result
 
 
+def bench_factor_cubic_cached_parse():
+    """Benchmark factor cubic (cached parse): factor(x^3-1)."""
+    return _poly_factor_cubic_expr.factor()
+
+
+_COMMON_FACTOR_EXTRACTION = 6*_X**2 + 12*_X + 18
+
+
 def bench_common_factor_extraction_direct():
     """Benchmark common factor extraction (direct API): 6x^2 + 12x + 18."""
-    x = symbol('x')
-    poly = 6*x**2 + 12*x + 18
-    result = poly.factor()
-    return result
+    return _COMMON_FACTOR_EXTRACTION.factor()
 
 
 def bench_common_factor_extraction_with_parsing():
@@ -192,68 +221,82 @@ def bench_common_factor_extraction_with_parsing():
     return result
 
 
+def bench_common_factor_extraction_cached_parse():
+    """Benchmark common factor extraction (cached parse): 6x^2 + 12x + 18."""
+    return _poly_common_factor_extraction_expr.factor()
+
+
 # ============================================================================
 # Polynomial Multiplication Benchmarks
 # ============================================================================
 
+_POLY_MULTIPLY_SMALL_F = _X + 1
+_POLY_MULTIPLY_SMALL_G = _X + 2
+
+
 def bench_poly_multiply_small_direct():
     """Benchmark small polynomial multiplication (direct API): (x+1)*(x+2)."""
-    x = symbol('x')
-    f = x + 1
-    g = x + 2
-    result = (f * g).simplify()
-    return result
+    return (_POLY_MULTIPLY_SMALL_F * _POLY_MULTIPLY_SMALL_G).simplify()
 
 
 def bench_poly_multiply_small_with_parsing():
     """Benchmark small polynomial multiplication (with parsing): (x+1)*(x+2)."""
-    expr = parse("(x + 1) * (x + 2)")
-    result = expr.simplify()
-    return result
+    return parse_and_simplify("(x + 1) * (x + 2)")
+
+
+def bench_poly_multiply_small_cached_parse():
+    """Benchmark small polynomial multiplication (cached parse): (x+1)*(x+2)."""
+    return _poly_multiply_small_expr.simplify()
+
+
+_POLY_MULTIPLY_MEDIUM_F = _X**2 + _X + 1
+_POLY_MULTIPLY_MEDIUM_G = _X**2 - 1
 
 
 def bench_poly_multiply_medium_direct():
     """Benchmark medium polynomial multiplication (direct API)."""
-    x = symbol('x')
-    f = x**2 + x + 1
-    g = x**2 - 1
-    result = (f * g).simplify()
-    return result
+    return (_POLY_MULTIPLY_MEDIUM_F * _POLY_MULTIPLY_MEDIUM_G).simplify()
 
 
 def bench_poly_multiply_medium_with_parsing():
     """Benchmark medium polynomial multiplication (with parsing)."""
-    expr = parse("(x^2 + x + 1) * (x^2 - 1)")
-    result = expr.simplify()
-    return result
+    return parse_and_simplify("(x^2 + x + 1) * (x^2 - 1)")
+
+
+def bench_poly_multiply_medium_cached_parse():
+    """Benchmark medium polynomial multiplication (cached parse)."""
+    return _poly_multiply_medium_expr.simplify()
+
+
+_POLY_MULTIPLY_LARGE_F = _X**4 + _X**3 + _X**2 + _X + 1
+_POLY_MULTIPLY_LARGE_G = _X**4 - _X**3 + _X**2 - _X + 1
 
 
 def bench_poly_multiply_large_direct():
     """Benchmark large polynomial multiplication (direct API)."""
-    x = symbol('x')
-    f = x**4 + x**3 + x**2 + x + 1
-    g = x**4 - x**3 + x**2 - x + 1
-    result = (f * g).simplify()
-    return result
+    return (_POLY_MULTIPLY_LARGE_F * _POLY_MULTIPLY_LARGE_G).simplify()
 
 
 def bench_poly_multiply_large_with_parsing():
     """Benchmark large polynomial multiplication (with parsing)."""
-    expr = parse("(x^4 + x^3 + x^2 + x + 1) * (x^4 - x^3 + x^2 - x + 1)")
-    result = expr.simplify()
-    return result
+    return parse_and_simplify("(x^4 + x^3 + x^2 + x + 1) * (x^4 - x^3 + x^2 - x + 1)")
+
+
+def bench_poly_multiply_large_cached_parse():
+    """Benchmark large polynomial multiplication (cached parse)."""
+    return _poly_multiply_large_expr.simplify()
 
 
 # ============================================================================
 # Polynomial Expansion Benchmarks
 # ============================================================================
 
+_BINOMIAL_EXPANSION_DEGREE_3 = (_X + 1) ** 3
+
+
 def bench_binomial_expansion_degree_3_direct():
     """Benchmark binomial expansion (direct API): (x+1)^3."""
-    x = symbol('x')
-    expr = (x + 1) ** 3
-    result = expr.expand()
-    return result
+    return _BINOMIAL_EXPANSION_DEGREE_3.expand()
 
 
 def bench_binomial_expansion_degree_3_with_parsing():
@@ -263,12 +306,17 @@ def bench_binomial_expansion_degree_3_with_parsing():
     return result
 
 
+def bench_binomial_expansion_degree_3_cached_parse():
+    """Benchmark binomial expansion (cached parse): (x+1)^3."""
+    return _poly_binomial_expansion_degree_3_expr.expand()
+
+
+_BINOMIAL_EXPANSION_DEGREE_5 = (_X + 1) ** 5
+
+
 def bench_binomial_expansion_degree_5_direct():
     """Benchmark binomial expansion (direct API): (x+1)^5."""
-    x = symbol('x')
-    expr = (x + 1) ** 5
-    result = expr.expand()
-    return result
+    return _BINOMIAL_EXPANSION_DEGREE_5.expand()
 
 
 def bench_binomial_expansion_degree_5_with_parsing():
@@ -278,6 +326,64 @@ def bench_binomial_expansion_degree_5_with_parsing():
     return result
 
 
+def bench_binomial_expansion_degree_5_cached_parse():
+    """Benchmark binomial expansion (cached parse): (x+1)^5."""
+    return _poly_binomial_expansion_degree_5_expr.expand()
+
+
+# Run order for run_all_benchmarks() and the --pyperf mode
+_BENCHMARKS = (
+    # GCD algorithms
+    bench_gcd_univariate_simple_direct,
+    bench_gcd_univariate_simple_with_parsing,
+    bench_gcd_univariate_simple_cached_parse,
+    bench_gcd_univariate_degree_10_direct,
+    bench_gcd_univariate_degree_10_with_parsing,
+    bench_gcd_univariate_degree_10_cached_parse,
+    bench_gcd_bivariate_simple_direct,
+    bench_gcd_bivariate_simple_with_parsing,
+    bench_gcd_bivariate_simple_cached_parse,
+
+    # Division
+    bench_division_simple_direct,
+    bench_division_simple_with_parsing,
+    bench_division_simple_cached_parse,
+    bench_division_degree_8_direct,
+    bench_division_degree_8_with_parsing,
+    bench_division_degree_8_cached_parse,
+
+    # Factorization
+    bench_factor_quadratic_direct,
+    bench_factor_quadratic_with_parsing,
+    bench_factor_quadratic_cached_parse,
+    bench_factor_cubic_direct,
+    bench_factor_cubic_with_parsing,
+    bench_factor_cubic_cached_parse,
+    bench_common_factor_extraction_direct,
+    bench_common_factor_extraction_with_parsing,
+    bench_common_factor_extraction_cached_parse,
+
+    # Multiplication
+    bench_poly_multiply_small_direct,
+    bench_poly_multiply_small_with_parsing,
+    bench_poly_multiply_small_cached_parse,
+    bench_poly_multiply_medium_direct,
+    bench_poly_multiply_medium_with_parsing,
+    bench_poly_multiply_medium_cached_parse,
+    bench_poly_multiply_large_direct,
+    bench_poly_multiply_large_with_parsing,
+    bench_poly_multiply_large_cached_parse,
+
+    # Expansion
+    bench_binomial_expansion_degree_3_direct,
+    bench_binomial_expansion_degree_3_with_parsing,
+    bench_binomial_expansion_degree_3_cached_parse,
+    bench_binomial_expansion_degree_5_direct,
+    bench_binomial_expansion_degree_5_with_parsing,
+    bench_binomial_expansion_degree_5_cached_parse,
+)
+
+
 # ============================================================================
 # Benchmark Runner
 # ============================================================================
@@ -286,49 +392,11 @@ def run_all_benchmarks(samples: int = 50) -> Dict[str, BenchmarkResult]:
     """Run all polynomial benchmarks."""
     results = {}
 
-    benchmarks = [
-        # GCD algorithms
-        bench_gcd_univariate_simple_direct,
-        bench_gcd_univariate_simple_with_parsing,
-        bench_gcd_univariate_degree_10_direct,
-        bench_gcd_univariate_degree_10_with_parsing,
-        bench_gcd_bivariate_simple_direct,
-        bench_gcd_bivariate_simple_with_parsing,
-
-        # Division
-        bench_division_simple_direct,
-        bench_division_simple_with_parsing,
-        bench_division_degree_8_direct,
-        bench_division_degree_8_with_parsing,
-
-        # Factorization
-        bench_factor_quadratic_direct,
-        bench_factor_quadratic_with_parsing,
-        bench_factor_cubic_direct,
-        bench_factor_cubic_with_parsing,
-        bench_common_factor_extraction_direct,
-        bench_common_factor_extraction_with_parsing,
-
-        # Multiplication
-        bench_poly_multiply_small_direct,
-        bench_poly_multiply_small_with_parsing,
-        bench_poly_multiply_medium_direct,
-        bench_poly_multiply_medium_with_parsing,
-        bench_poly_multiply_large_direct,
-        bench_poly_multiply_large_with_parsing,
-
-        # Expansion
-        bench_binomial_expansion_degree_3_direct,
-        bench_binomial_expansion_degree_3_with_parsing,
-        bench_binomial_expansion_degree_5_direct,
-        bench_binomial_expansion_degree_5_with_parsing,
-    ]
-
     print("=" * 80)
     print("Polynomial Benchmarks")
     print("=" * 80)
 
-    for bench_func in benchmarks:
+    for bench_func in _BENCHMARKS:
         print(f"Running {bench_func.__name__}...", end=" ")
         result = benchmark(bench_func, samples=samples)
         results[bench_func.__name__] = result
@@ -341,6 +409,10 @@ def run_all_benchmarks(samples: int = 50) -> Dict[str, BenchmarkResult]:
 
 def main():
     """Main entry point for polynomial benchmarks."""
+    if PYPERF_FLAG in sys.argv:
+        run_pyperf(_BENCHMARKS)
+        return
+
     results = run_all_benchmarks(samples=50)
 
     print("\nDetailed Results:")
@@ -6,7 +6,9 @@ Runs all benchmark categories and outputs combined JSON results.
 
 import argparse
 import json
+import math
 import sys
+from contextlib import nullcontext, redirect_stdout
 from typing import Dict, Any
 
 try:
@@ -23,6 +25,13 @@ import simplification_benchmarks
 import function_evaluation_benchmarks
 import polynomial_benchmarks
 import parsing_benchmarks
+from _bench_harness import driver_overhead_ns, pin_to_core
+
+# Optional: orjson serializes the result files faster; json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 BENCHMARK_CATEGORIES = {
@@ -35,6 +44,9 @@ BENCHMARK_CATEGORIES = {
     "parsing": (parsing_benchmarks, "Parsing"),
 }
 
+# Results key holding run-wide values; every other key is a category
+METADATA_KEY = "metadata"
+
 
 def format_result_to_dict(result) -> Dict[str, Any]:
     """Convert BenchmarkResult to dictionary for JSON serialization."""
@@ -66,6 +78,42 @@ def run_category(category_name: str, module, samples: int = 100) -> Dict[str, An
     return json_results
 
 
+def write_ndjson(results: Dict[str, Any], path: str):
+    """
+    Write one JSON object per benchmark (newline-delimited) for CI tooling.
+
+    A path of "-" writes to stdout.
+    """
+    metadata = results.get(METADATA_KEY, {})
+    records = (
+        {"category": category, **result, **metadata}
+        for category, category_results in results.items()
+        if category != METADATA_KEY
+        for result in category_results.values()
+    )
+    if path == "-":
+        sys.stdout.flush()
+        out = nullcontext(sys.stdout.buffer)
+    else:
+        out = open(path, "wb")
+    with out as f:
+        if orjson is not None:
+            f.writelines(orjson.dumps(record) + b"\n" for record in records)
+        else:
+            f.writelines((json.dumps(record) + "\n").encode() for record in records)
+        f.flush()
+
+
+def write_json(results: Dict[str, Any], path: str):
+    """Write all results as one indented JSON document."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
 def run_all_benchmarks(categories=None, samples: int = 100) -> Dict[str, Any]:
     """
     Run all or specified benchmark categories.
@@ -75,12 +123,14 @@ def run_all_benchmarks(categories=None, samples: int = 100) -> Dict[str, Any]:
         samples: Number of samples per benchmark
 
     Returns:
-        Dictionary with all benchmark results
+        Dictionary with all benchmark results, plus run-wide values under
+        METADATA_KEY
     """
     if categories is None:
         categories = list(BENCHMARK_CATEGORIES.keys())
 
-    all_results = {}
+    # Cost floor included in every result timed through _bench_harness
+    all_results = {METADATA_KEY: {"driver_overhead_ns": driver_overhead_ns()}}
 
     for category in categories:
         if category not in BENCHMARK_CATEGORIES:
@@ -101,6 +151,8 @@ def print_summary(results: Dict[str, Any]):
     print("=" * 80)
 
     for category, category_results in results.items():
+        if category == METADATA_KEY:
+            continue
         category_name = BENCHMARK_CATEGORIES[category][1]
         print(f"\n{category_name}:")
         print("-" * 80)
@@ -108,15 +160,13 @@ def print_summary(results: Dict[str, Any]):
         # Calculate category statistics
         all_means = [result["mean_ns"] for result in category_results.values()]
         if all_means:
-            min_mean = min(all_means)
-            max_mean = max(all_means)
-            avg_mean = sum(all_means) / len(all_means)
-
             print(f"  Benchmarks: {len(category_results)}")
-            print(f"  Fastest:    {min_mean:.2f}ns")
-            print(f"  Slowest:    {max_mean:.2f}ns")
-            print(f"  Average:    {avg_mean:.2f}ns")
+            print(f"  Fastest:    {min(all_means):.2f}ns")
+            print(f"  Slowest:    {max(all_means):.2f}ns")
+            print(f"  Average:    {math.fsum(all_means) / len(all_means):.2f}ns")
 
+    overhead_ns = results[METADATA_KEY]["driver_overhead_ns"]
+    print(f"\nHarness overhead (empty function): {overhead_ns:.2f}ns")
     print("\n" + "=" * 80)
 
 
@@ -132,6 +182,9 @@ Examples:
   %(prog)s --category core calculus     # Run core and calculus benchmarks
   %(prog)s --samples 50                 # Run with 50 samples per benchmark
   %(prog)s --output results.json        # Save results to JSON file
+  %(prog)s --json results.ndjson        # One JSON line per benchmark (CI)
+  %(prog)s --json - > results.ndjson    # Same, on stdout (other output to stderr)
+  %(prog)s --pin-core 2                 # Pin to CPU 2 for lower-noise timings
         """
     )
 
@@ -158,6 +211,14 @@ Examples:
         help="Output JSON file path (optional)",
     )
 
+    parser.add_argument(
+        "--json",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Write newline-delimited JSON, one line per benchmark; '-' for stdout (optional)",
+    )
+
     parser.add_argument(
         "--quiet",
         "-q",
@@ -165,20 +226,37 @@ Examples:
         help="Suppress detailed output, only show summary",
     )
 
+    parser.add_argument(
+        "--pin-core",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Pin the benchmark process to CPU N (Linux)",
+    )
+
     args = parser.parse_args()
 
-    # Run benchmarks
-    results = run_all_benchmarks(categories=args.category, samples=args.samples)
+    if args.pin_core is not None:
+        pin_to_core(args.pin_core)
 
-    # Print summary
-    if not args.quiet:
-        print_summary(results)
+    # With --json -, stdout carries only the NDJSON lines; everything else goes to stderr
+    human_output = redirect_stdout(sys.stderr) if args.json == "-" else nullcontext()
 
-    # Save to JSON if requested
-    if args.output:
-        with open(args.output, "w") as f:
-            json.dump(results, f, indent=2)
-        print(f"\nResults saved to: {args.output}")
+    with human_output:
+        # Run benchmarks
+        results = run_all_benchmarks(categories=args.category, samples=args.samples)
+
+        # Print summary
+        if not args.quiet:
+            print_summary(results)
+
+        # Save to JSON if requested
+        if args.output:
+            write_json(results, args.output)
+            print(f"\nResults saved to: {args.output}")
+
+    if args.json:
+        write_ndjson(results, args.json)
 
     # Return success
     return 0
@@ -7,60 +7,50 @@ Tests: Linear, quadratic, polynomial, system equation solving
 Last Updated: 2025-12-28T1200
 """
 
-import time
-import statistics
-from typing import Dict, List
+from typing import Dict
+
+from _bench_harness import BenchmarkResult, benchmark
 
 try:
-    from mathhook import symbol, symbols, parse, solve
+    from mathhook import symbol, parse, solve
 except ImportError:
     print("ERROR: mathhook Python bindings not found. Install with: pip install mathhook")
     exit(1)
 
 
-class BenchmarkResult:
-    """Stores benchmark timing results."""
-
-    def __init__(self, name: str, times_ns: List[int]):
-        self.name = name
-        self.times_ns = times_ns
-        self.mean_ns = statistics.mean(times_ns)
-        self.median_ns = statistics.median(times_ns)
-        self.min_ns = min(times_ns)
-        self.max_ns = max(times_ns)
-        self.std_dev_ns = statistics.stdev(times_ns) if len(times_ns) > 1 else 0.0
-        self.samples = len(times_ns)
-
-    def __repr__(self):
-        return (f"{self.name}: {self.mean_ns:.2f}ns ± {self.std_dev_ns:.2f}ns "
-                f"(median: {self.median_ns:.2f}ns)")
+# ============================================================================
+# Shared Symbols
+# ============================================================================
 
+_X = symbol('x')
+_Y = symbol('y')
 
-def benchmark(func, samples: int = 100, warmup: int = 10) -> BenchmarkResult:
-    """Benchmark a function with warmup and multiple samples."""
-    for _ in range(warmup):
-        func()
 
-    times_ns = []
-    for _ in range(samples):
-        start = time.perf_counter_ns()
-        func()
-        end = time.perf_counter_ns()
-        times_ns.append(end - start)
+# ============================================================================
+# Pre-parsed Expressions (inputs of the *_cached_parse benches)
+# ============================================================================
 
-    return BenchmarkResult(func.__name__, times_ns)
+_solve_linear_simple_expr = parse("2*x + 3")
+_solve_linear_large_coeffs_expr = parse("1000*x + 500")
+_solve_quadratic_simple_expr = parse("x^2 - 4")
+_solve_quadratic_complex_roots_expr = parse("x^2 + 1")
+_solve_quadratic_general_expr = parse("2*x^2 + 3*x - 5")
+_solve_cubic_equation_expr = parse("x^3 - 6*x^2 + 11*x - 6")
+_solve_quartic_equation_expr = parse("x^4 - 5*x^2 + 4")
+_solve_system_2_equations_eq1 = parse("x + y - 3")
+_solve_system_2_equations_eq2 = parse("2*x - y")
 
 
 # ============================================================================
 # Linear Equation Solving Benchmarks
 # ============================================================================
 
+_LINEAR_SIMPLE = 2*_X + 3
+
+
 def bench_linear_simple_direct():
     """Benchmark simple linear equation solving (direct API): 2x + 3 = 0."""
-    x = symbol('x')
-    equation = 2*x + 3
-    result = solve(equation, 'x')
-    return result
+    return solve(_LINEAR_SIMPLE, 'x')
 
 
 def bench_linear_simple_with_parsing():
@@ -69,12 +59,17 @@ def bench_linear_simple_with_parsing():
     return result
 
 
+def bench_linear_simple_cached_parse():
+    """Benchmark simple linear equation solving (cached parse): 2x + 3 = 0."""
+    return solve(_solve_linear_simple_expr, 'x')
+
+
+_LINEAR_LARGE_COEFFS = 1000*_X + 500
+
+
 def bench_linear_large_coeffs_direct():
     """Benchmark linear with large coefficients (direct API)."""
-    x = symbol('x')
-    equation = 1000*x + 500
-    result = solve(equation, 'x')
-    return result
+    return solve(_LINEAR_LARGE_COEFFS, 'x')
 
 
 def bench_linear_large_coeffs_with_parsing():
@@ -83,16 +78,21 @@ def bench_linear_large_coeffs_with_parsing():
     return result
 
 
+def bench_linear_large_coeffs_cached_parse():
+    """Benchmark linear with large coefficients (cached parse)."""
+    return solve(_solve_linear_large_coeffs_expr, 'x')
+
+
 # ============================================================================
 # Quadratic Equation Solving Benchmarks
 # ============================================================================
 
+_QUADRATIC_SIMPLE = _X**2 - 4
+
+
 def bench_quadratic_simple_direct():
     """Benchmark simple quadratic (direct API): x^2 - 4 = 0."""
-    x = symbol('x')
-    equation = x**2 - 4
-    result = solve(equation, 'x')
-    return result
+    return solve(_QUADRATIC_SIMPLE, 'x')
 
 
 def bench_quadratic_simple_with_parsing():
@@ -101,12 +101,17 @@ def bench_quadratic_simple_with_parsing():
     return result
 
 
+def bench_quadratic_simple_cached_parse():
+    """Benchmark simple quadratic (cached parse): x^2 - 4 = 0."""
+    return solve(_solve_quadratic_simple_expr, 'x')
+
+
+_QUADRATIC_COMPLEX_ROOTS = _X**2 + 1
+
+
 def bench_quadratic_complex_roots_direct():
     """Benchmark quadratic with complex roots (direct API): x^2 + 1 = 0."""
-    x = symbol('x')
-    equation = x**2 + 1
-    result = solve(equation, 'x')
-    return result
+    return solve(_QUADRATIC_COMPLEX_ROOTS, 'x')
 
 
 def bench_quadratic_complex_roots_with_parsing():
@@ -115,12 +120,17 @@ def bench_quadratic_complex_roots_with_parsing():
     return result
 
 
+def bench_quadratic_complex_roots_cached_parse():
+    """Benchmark quadratic with complex roots (cached parse): x^2 + 1 = 0."""
+    return solve(_solve_quadratic_complex_roots_expr, 'x')
+
+
+_QUADRATIC_GENERAL = 2*_X**2 + 3*_X - 5
+
+
 def bench_quadratic_general_direct():
     """Benchmark general quadratic (direct API): 2x^2 + 3x - 5 = 0."""
-    x = symbol('x')
-    equation = 2*x**2 + 3*x - 5
-    result = solve(equation, 'x')
-    return result
+    return solve(_QUADRATIC_GENERAL, 'x')
 
 
 def bench_quadratic_general_with_parsing():
@@ -129,16 +139,21 @@ def bench_quadratic_general_with_parsing():
     return result
 
 
+def bench_quadratic_general_cached_parse():
+    """Benchmark general quadratic (cached parse): 2x^2 + 3x - 5 = 0."""
+    return solve(_solve_quadratic_general_expr, 'x')
+
+
 # ============================================================================
 # Polynomial Equation Solving Benchmarks
 # ============================================================================
 
+_CUBIC_EQUATION = _X**3 - 6*_X**2 + 11*_X - 6
+
+
 def bench_cubic_equation_direct():
     """Benchmark cubic equation (direct API): x^3 - 6x^2 + 11x - 6 = 0."""
-    x = symbol('x')
-    equation = x**3 - 6*x**2 + 11*x - 6
-    result = solve(equation, 'x')
-    return result
+    return solve(_CUBIC_EQUATION, 'x')
 
 
 def bench_cubic_equation_with_parsing():
@@ -147,12 +162,17 @@ def bench_cubic_equation_with_parsing():
     return result
 
 
+def bench_cubic_equation_cached_parse():
+    """Benchmark cubic equation (cached parse): x^3 - 6x^2 + 11x - 6 = 0."""
+    return solve(_solve_cubic_equation_expr, 'x')
+
+
+_QUARTIC_EQUATION = _X**4 - 5*_X**2 + 4
+
+
 def bench_quartic_equation_direct():
     """Benchmark quartic equation (direct API): x^4 - 5x^2 + 4 = 0."""
-    x = symbol('x')
-    equation = x**4 - 5*x**2 + 4
-    result = solve(equation, 'x')
-    return result
+    return solve(_QUARTIC_EQUATION, 'x')
 
 
 def bench_quartic_equation_with_parsing():
@@ -161,21 +181,26 @@ def bench_quartic_equation_with_parsing():
     return result
 
 
+def bench_quartic_equation_cached_parse():
+    """Benchmark quartic equation (cached parse): x^4 - 5x^2 + 4 = 0."""
+    return solve(_solve_quartic_equation_expr, 'x')
+
+
 # ============================================================================
 # System of Equations Solving Benchmarks (using individual solves)
 # ============================================================================
 
+# Solve x + y = 3 for x, then substitute
+_SYSTEM_EQ1 = _X + _Y - 3
+_SYSTEM_EQ2 = 2*_X - _Y
+
+
 def bench_system_2_equations_direct():
     """Benchmark solving 2 equations sequentially (direct API)."""
-    x, y = symbols('x y')
-    # Solve x + y = 3 for x, then substitute
-    eq1 = x + y - 3
-    eq2 = 2*x - y
-
     # Solve first equation
-    solutions1 = solve(eq1, 'x')
+    solutions1 = solve(_SYSTEM_EQ1, 'x')
     # Solve second equation
-    solutions2 = solve(eq2, 'x')
+    solutions2 = solve(_SYSTEM_EQ2, 'x')
     return (solutions1, solutions2)
 
 
@@ -189,6 +214,49 @@ def bench_system_2_equations_with_parsing():
     return (solutions1, solutions2)
 
 
+def bench_system_2_equations_cached_parse():
+    """Benchmark solving 2 equations sequentially (cached parse)."""
+    solutions1 = solve(_solve_system_2_equations_eq1, 'x')
+    solutions2 = solve(_solve_system_2_equations_eq2, 'x')
+    return (solutions1, solutions2)
+
+
+# Run order for run_all_benchmarks()
+_BENCHMARKS = (
+    # Linear equations
+    bench_linear_simple_direct,
+    bench_linear_simple_with_parsing,
+    bench_linear_simple_cached_parse,
+    bench_linear_large_coeffs_direct,
+    bench_linear_large_coeffs_with_parsing,
+    bench_linear_large_coeffs_cached_parse,
+
+    # Quadratic equations
+    bench_quadratic_simple_direct,
+    bench_quadratic_simple_with_parsing,
+    bench_quadratic_simple_cached_parse,
+    bench_quadratic_complex_roots_direct,
+    bench_quadratic_complex_roots_with_parsing,
+    bench_quadratic_complex_roots_cached_parse,
+    bench_quadratic_general_direct,
+    bench_quadratic_general_with_parsing,
+    bench_quadratic_general_cached_parse,
+
+    # Polynomial equations
+    bench_cubic_equation_direct,
+    bench_cubic_equation_with_parsing,
+    bench_cubic_equation_cached_parse,
+    bench_quartic_equation_direct,
+    bench_quartic_equation_with_parsing,
+    bench_quartic_equation_cached_parse,
+
+    # System of equations
+    bench_system_2_equations_direct,
+    bench_system_2_equations_with_parsing,
+    bench_system_2_equations_cached_parse,
+)
+
+
 # ============================================================================
 # Benchmark Runner
 # ============================================================================
@@ -197,37 +265,11 @@ def run_all_benchmarks(samples: int = 100) -> Dict[str, BenchmarkResult]:
     """Run all solving benchmarks."""
     results = {}
 
-    benchmarks = [
-        # Linear equations
-        bench_linear_simple_direct,
-        bench_linear_simple_with_parsing,
-        bench_linear_large_coeffs_direct,
-        bench_linear_large_coeffs_with_parsing,
-
-        # Quadratic equations
-        bench_quadratic_simple_direct,
-        bench_quadratic_simple_with_parsing,
-        bench_quadratic_complex_roots_direct,
-        bench_quadratic_complex_roots_with_parsing,
-        bench_quadratic_general_direct,
-        bench_quadratic_general_with_parsing,
-
-        # Polynomial equations
-        bench_cubic_equation_direct,
-        bench_cubic_equation_with_parsing,
-        bench_quartic_equation_direct,
-        bench_quartic_equation_with_parsing,
-
-        # System of equations
-        bench_system_2_equations_direct,
-        bench_system_2_equations_with_parsing,
-    ]
-
     print("=" * 80)
     print("Solving Benchmarks")
     print("=" * 80)
 
-    for bench_func in benchmarks:
+    for bench_func in _BENCHMARKS:
         print(f"Running {bench_func.__name__}...", end=" ")
         result = benchmark(bench_func, samples=samples)
         results[bench_func.__name__] = result
@@ -98,6 +98,41 @@ pub fn symbol(name: &str) -> PyExpression {
     }
 }
 
+/// Return the shared symbol expression for a name
+///
+/// Repeated calls with the same name return the same Python object instead of
+/// building a new wrapper each time (the core interns the name either way).
+/// Expressions are immutable, so sharing one object is safe.
+///
+/// # Arguments
+///
+/// * `name` - The symbol name
+///
+/// # Examples
+///
+/// ```python
+/// from mathhook import intern_symbol
+///
+/// assert intern_symbol('x') is intern_symbol('x')
+/// ```
+#[pyfunction]
+pub fn intern_symbol(py: Python<'_>, name: &str) -> PyResult<Py<PyAny>> {
+    use pyo3::sync::PyOnceLock;
+    use pyo3::types::PyDict;
+
+    // A dict guarded by the GIL, so no Rust lock is held across Python calls
+    static INTERNED: PyOnceLock<Py<PyDict>> = PyOnceLock::new();
+    let interned = INTERNED
+        .get_or_init(py, || PyDict::new(py).unbind())
+        .bind(py);
+    if let Some(sym) = interned.get_item(name)? {
+        return Ok(sym.unbind());
+    }
+    let sym = Py::new(py, symbol(name))?.into_any();
+    interned.set_item(name, &sym)?;
+    Ok(sym)
+}
+
 /// Solve an equation for a variable
 ///
 /// Solves the equation `expression = 0` for the given variable.
@@ -174,6 +209,239 @@ pub fn parse(input: &str) -> PyResult<PyExpression> {
     }
 }
 
+/// Parse a mathematical expression given as UTF-8 `bytes`
+///
+/// Same as `parse`, but takes the input as `bytes`, which is borrowed
+/// without conversion; useful when inputs are already encoded or reused.
+///
+/// # Arguments
+///
+/// * `input` - UTF-8 encoded expression (same syntax as `parse`)
+///
+/// # Examples
+///
+/// ```python
+/// from mathhook import parse_bytes
+///
+/// expr = parse_bytes(b'x^2 + 2*x + 1')
+/// ```
+#[pyfunction]
+pub fn parse_bytes(input: &[u8]) -> PyResult<PyExpression> {
+    use mathhook_core::{Parser, ParserConfig};
+    let input = std::str::from_utf8(input).map_err(|e| {
+        pyo3::exceptions::PyValueError::new_err(format!("Input is not valid UTF-8: {}", e))
+    })?;
+    let parser = Parser::new(&ParserConfig::default());
+    match parser.parse(input) {
+        Ok(expr) => Ok(PyExpression { inner: expr }),
+        Err(e) => Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "Parse error: {}",
+            e
+        ))),
+    }
+}
+
+/// Parse a mathematical expression and simplify it in one call
+///
+/// Equivalent to `parse(input).simplify()`, without creating the intermediate
+/// Python expression or crossing the Python/Rust boundary twice.
+///
+/// # Arguments
+///
+/// * `input` - The mathematical expression string (same syntax as `parse`)
+///
+/// # Examples
+///
+/// ```python
+/// from mathhook import parse_and_simplify
+///
+/// expr = parse_and_simplify('x + x + x')  # 3*x
+/// ```
+#[pyfunction]
+pub fn parse_and_simplify(input: &str) -> PyResult<PyExpression> {
+    use mathhook_core::{Parser, ParserConfig, Simplify};
+    let parser = Parser::new(&ParserConfig::default());
+    match parser.parse(input) {
+        Ok(expr) => Ok(PyExpression {
+            inner: expr.simplify(),
+        }),
+        Err(e) => Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "Parse error: {}",
+            e
+        ))),
+    }
+}
+
+/// Parse several mathematical expressions in one call
+///
+/// Uses a single parser for the whole batch, so per-call setup and the
+/// Python/Rust boundary crossing are paid once instead of once per string.
+/// The GIL is released while parsing, and batches at or above the core
+/// parallel threshold are parsed across threads. Results keep input order.
+///
+/// # Arguments
+///
+/// * `inputs` - Expression strings (same syntax as `parse`)
+///
+/// # Examples
+///
+/// ```python
+/// from mathhook import parse_batch
+///
+/// f, g = parse_batch(["x^2 - 1", "x - 1"])
+/// ```
+#[pyfunction]
+pub fn parse_batch(py: Python<'_>, inputs: Vec<String>) -> PyResult<Vec<PyExpression>> {
+    use mathhook_core::core::meets_parallel_threshold;
+    use mathhook_core::{Parser, ParserConfig};
+    use rayon::prelude::*;
+
+    let parser = Parser::new(&ParserConfig::default());
+    let parse_one = |input: &String| {
+        parser
+            .parse(input)
+            .map_err(|e| format!("Parse error in '{}': {}", input, e))
+    };
+    let parsed: Result<Vec<_>, String> = py.detach(|| {
+        if meets_parallel_threshold(inputs.len()) {
+            inputs.par_iter().map(parse_one).collect()
+        } else {
+            inputs.iter().map(parse_one).collect()
+        }
+    });
+    parsed
+        .map(|exprs| {
+            exprs
+                .into_iter()
+                .map(|inner| PyExpression { inner })
+                .collect()
+        })
+        .map_err(pyo3::exceptions::PyValueError::new_err)
+}
+
+/// Simplify several expressions in one call
+///
+/// Returns `[e.simplify() for e in exprs]` from a single boundary crossing.
+/// The GIL is released while simplifying, and lists at or above the core
+/// parallel threshold are simplified across threads. Results keep input order.
+///
+/// # Arguments
+///
+/// * `exprs` - Expressions to simplify
+///
+/// # Examples
+///
+/// ```python
+/// from mathhook import parse, simplify_many
+///
+/// a, b = simplify_many([parse('x + x'), parse('2*x - x')])
+/// ```
+#[pyfunction]
+pub fn simplify_many(py: Python<'_>, exprs: Vec<PyExpression>) -> Vec<PyExpression> {
+    use mathhook_core::core::meets_parallel_threshold;
+    use mathhook_core::Simplify;
+    use rayon::prelude::*;
+
+    let inputs: Vec<Expression> = exprs.into_iter().map(|e| e.inner).collect();
+    let simplified: Vec<Expression> = py.detach(|| {
+        if meets_parallel_threshold(inputs.len()) {
+            inputs.par_iter().map(|e| e.simplify()).collect()
+        } else {
+            inputs.iter().map(|e| e.simplify()).collect()
+        }
+    });
+    simplified
+        .into_iter()
+        .map(|inner| PyExpression { inner })
+        .collect()
+}
+
+/// Entries kept per memo table before it is cleared and refilled
+const MEMO_SIZE_LIMIT: usize = 10_000;
+
+type MemoTable = std::sync::Mutex<std::collections::HashMap<String, Expression>>;
+
+/// Look `expr` up in `table` by structure, computing and storing `op(expr)` on a miss
+///
+/// The key is the expression's structural (`Debug`) form, so equal trees hit
+/// regardless of which Python object holds them. The lock is not held while
+/// `op` runs, and the GIL is released for the whole call.
+fn memoized(
+    py: Python<'_>,
+    table: &'static std::sync::OnceLock<MemoTable>,
+    expr: &Expression,
+    op: fn(&Expression) -> Expression,
+) -> Expression {
+    py.detach(|| {
+        let table = table.get_or_init(Default::default);
+        let key = format!("{:?}", expr);
+        if let Some(hit) = table.lock().unwrap().get(&key) {
+            return hit.clone();
+        }
+        let result = op(expr);
+        let mut entries = table.lock().unwrap();
+        if entries.len() >= MEMO_SIZE_LIMIT {
+            entries.clear();
+        }
+        entries.insert(key, result.clone());
+        result
+    })
+}
+
+/// Factor an expression, memoizing the result by structure
+///
+/// Same result as `expr.factor()`. Repeated calls on structurally equal
+/// inputs return the stored result instead of factoring again; the first call
+/// pays for building the key and the table holds up to 10,000 results for the
+/// life of the process, so use it only where the same inputs recur.
+///
+/// # Arguments
+///
+/// * `expr` - Expression to factor
+///
+/// # Examples
+///
+/// ```python
+/// from mathhook import parse, factor_cached
+///
+/// result = factor_cached(parse('x^2 + 2*x'))
+/// ```
+#[pyfunction]
+pub fn factor_cached(py: Python<'_>, expr: &PyExpression) -> PyExpression {
+    use mathhook_core::Factor;
+
+    static FACTORED: std::sync::OnceLock<MemoTable> = std::sync::OnceLock::new();
+    PyExpression {
+        inner: memoized(py, &FACTORED, &expr.inner, <Expression as Factor>::factor),
+    }
+}
+
+/// Expand an expression, memoizing the result by structure
+///
+/// Same result as `expr.expand()`, with the same cache behaviour and memory
+/// tradeoff as `factor_cached`.
+///
+/// # Arguments
+///
+/// * `expr` - Expression to expand
+///
+/// # Examples
+///
+/// ```python
+/// from mathhook import parse, expand_cached
+///
+/// result = expand_cached(parse('(x + 1)^2'))
+/// ```
+#[pyfunction]
+pub fn expand_cached(py: Python<'_>, expr: &PyExpression) -> PyExpression {
+    use mathhook_core::Expand;
+
+    static EXPANDED: std::sync::OnceLock<MemoTable> = std::sync::OnceLock::new();
+    PyExpression {
+        inner: memoized(py, &EXPANDED, &expr.inner, <Expression as Expand>::expand),
+    }
+}
+
 mathhook_macros::generate_python_binding!(sin);
 
 mathhook_macros::generate_python_binding!(cos);
@@ -321,6 +589,145 @@ pub fn roots(poly: &PyExpression, variable: String) -> PyExpression {
     }
 }
 
+/// Build a polynomial expression from dense integer coefficients
+///
+/// Constructs the expression directly from the coefficient vector, without
+/// formatting and re-parsing a string.
+///
+/// # Arguments
+///
+/// * `coeffs` - Coefficients in ascending order (`coeffs[i]` multiplies `variable^i`)
+/// * `variable` - Variable name
+///
+/// # Examples
+///
+/// ```python
+/// from mathhook import poly_from_dense
+///
+/// p = poly_from_dense([1, 2, 1], 'x')  # x^2 + 2*x + 1
+/// ```
+#[pyfunction]
+pub fn poly_from_dense(coeffs: Vec<i64>, variable: &str) -> PyExpression {
+    use mathhook_core::core::polynomial::poly::IntPoly;
+
+    PyExpression {
+        inner: IntPoly::from_coeffs(coeffs).to_expression(&Symbol::new(variable)),
+    }
+}
+
+/// Build a polynomial expression from sparse integer coefficients
+///
+/// Builds one `coeff * variable^exponent` term per nonzero entry, so the cost
+/// depends on the number of terms, not on the largest exponent.
+///
+/// # Arguments
+///
+/// * `terms` - Mapping from non-negative exponent to coefficient
+/// * `variable` - Variable name
+///
+/// # Examples
+///
+/// ```python
+/// from mathhook import poly_from_sparse
+///
+/// p = poly_from_sparse({0: 1, 50: 1, 100: 1}, 'x')  # 1 + x^50 + x^100
+/// ```
+#[pyfunction]
+pub fn poly_from_sparse(
+    terms: std::collections::BTreeMap<i64, i64>,
+    variable: &str,
+) -> PyResult<PyExpression> {
+    if let Some(&exponent) = terms.keys().next().filter(|&&e| e < 0) {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "Exponents must be non-negative, got {}",
+            exponent
+        )));
+    }
+
+    // The canonical constructors fold x^0, x^1 and 1*t, so each term is built the same way
+    let var = Expression::symbol(Symbol::new(variable));
+    let monomials = terms
+        .into_iter()
+        .filter(|&(_, coeff)| coeff != 0)
+        .map(|(exponent, coeff)| {
+            Expression::mul(vec![
+                Expression::integer(coeff),
+                Expression::pow(var.clone(), Expression::integer(exponent)),
+            ])
+        })
+        .collect();
+
+    Ok(PyExpression {
+        inner: Expression::add(monomials),
+    })
+}
+
+/// Build an expression from a nested tuple spec in a single call
+///
+/// Spec nodes:
+///
+/// * `("sym", name)` - a symbol
+/// * `("fn", name, (arg, ...))` - a function application, using the internal
+///   function name (e.g. `"ln"` for natural log, `"abs"` for absolute value)
+/// * anything else - converted like any function argument (Expression, int, float, str)
+///
+/// # Examples
+///
+/// ```python
+/// from mathhook import build_expr
+///
+/// expr = build_expr(("fn", "sin", (("fn", "cos", (("sym", "x"),)),)))  # sin(cos(x))
+/// ```
+#[pyfunction]
+pub fn build_expr(spec: &Bound<'_, PyAny>) -> PyResult<PyExpression> {
+    Ok(PyExpression {
+        inner: expression_from_spec(spec)?,
+    })
+}
+
+fn expression_from_spec(spec: &Bound<'_, PyAny>) -> PyResult<Expression> {
+    use pyo3::types::{PyList, PyTuple};
+
+    let Ok(node) = spec.cast::<PyTuple>() else {
+        return sympify_python(spec);
+    };
+    let tag: String = node.get_item(0)?.extract()?;
+    match (tag.as_str(), node.len()) {
+        ("sym", 2) => {
+            let name: String = node.get_item(1)?.extract()?;
+            Ok(Expression::symbol(Symbol::new(&name)))
+        }
+        ("fn", 3) => {
+            let name: String = node.get_item(1)?.extract()?;
+            let args_spec = node.get_item(2)?;
+            let is_node = args_spec.cast::<PyTuple>().is_ok_and(|items| {
+                items.get_item(0).is_ok_and(|head| {
+                    head.extract::<String>()
+                        .is_ok_and(|tag| tag == "sym" || tag == "fn")
+                })
+            });
+            let is_seq =
+                args_spec.is_instance_of::<PyTuple>() || args_spec.is_instance_of::<PyList>();
+            if is_node || !is_seq {
+                return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                    "Invalid arguments for function '{}': expected a tuple or list of specs",
+                    name
+                )));
+            }
+            let args = args_spec
+                .try_iter()?
+                .map(|arg| expression_from_spec(&arg?))
+                .collect::<PyResult<Vec<_>>>()?;
+            Ok(Expression::function(name, args))
+        }
+        _ => Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "Invalid expression spec node '{}' with {} items",
+            tag,
+            node.len()
+        ))),
+    }
+}
+
 #[doc = " Initialize printing for Jupyter/IPython"]
 #[doc = ""]
 #[doc = " Configures how MathHook expressions are displayed in Jupyter notebooks,"]
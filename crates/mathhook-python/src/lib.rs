@@ -33,8 +33,15 @@ fn mathhook(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // Register functions from functions module
     m.add_function(wrap_pyfunction!(functions::parse, m)?)?;
+    m.add_function(wrap_pyfunction!(functions::parse_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(functions::parse_and_simplify, m)?)?;
+    m.add_function(wrap_pyfunction!(functions::parse_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(functions::simplify_many, m)?)?;
+    m.add_function(wrap_pyfunction!(functions::factor_cached, m)?)?;
+    m.add_function(wrap_pyfunction!(functions::expand_cached, m)?)?;
     m.add_function(wrap_pyfunction!(functions::symbols, m)?)?;
     m.add_function(wrap_pyfunction!(functions::symbol, m)?)?;
+    m.add_function(wrap_pyfunction!(functions::intern_symbol, m)?)?;
     m.add_function(wrap_pyfunction!(functions::solve, m)?)?;
     m.add_function(wrap_pyfunction!(functions::init_printing, m)?)?;
     m.add_function(wrap_pyfunction!(functions::pprint, m)?)?;
@@ -72,6 +79,9 @@ fn mathhook(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(functions::beta, m)?)?;
     m.add_function(wrap_pyfunction!(functions::degree, m)?)?;
     m.add_function(wrap_pyfunction!(functions::roots, m)?)?;
+    m.add_function(wrap_pyfunction!(functions::poly_from_dense, m)?)?;
+    m.add_function(wrap_pyfunction!(functions::poly_from_sparse, m)?)?;
+    m.add_function(wrap_pyfunction!(functions::build_expr, m)?)?;
 
     // Register macro-generated functions for benchmarking
     m.add_function(wrap_pyfunction!(
@@ -3,8 +3,14 @@
 This test suite verifies that all Week 1 features work together seamlessly,
 testing realistic workflows that combine operators, symbols, functions, and display.
 """
+import pytest
+
 import mathhook
-from mathhook import symbols, sin, cos, tan, exp, log, sqrt
+from mathhook import (
+    symbols, sin, cos, tan, exp, log, sqrt,
+    parse, parse_bytes, parse_batch, parse_and_simplify, simplify_many,
+    poly_from_dense, poly_from_sparse, build_expr, factor_cached, expand_cached
+)
 
 
 def test_complete_workflow():
@@ -385,3 +391,101 @@ def test_no_regressions():
     # Test that basic operations still work with operator overloading
     expr = x + 1
     assert str(expr)
+
+
+def test_poly_from_dense():
+    """Test poly_from_dense() builds the same polynomial as parsing"""
+    result = poly_from_dense([1, 2, 1], 'x')
+    assert str(result.simplify()) == str(parse('x^2 + 2*x + 1').simplify())
+
+
+def test_poly_from_sparse():
+    """Test poly_from_sparse() with gaps between exponents"""
+    result = poly_from_sparse({0: 1, 5: 3}, 'x')
+    assert str(result.simplify()) == str(parse('3*x^5 + 1').simplify())
+
+
+def test_poly_from_sparse_large_exponent():
+    """Test poly_from_sparse() does not allocate up to the largest exponent"""
+    result = poly_from_sparse({10**12: 1, 1: 0, 0: -2}, 'x')
+    assert str(result.simplify()) == str(parse('x^1000000000000 - 2').simplify())
+
+
+def test_poly_from_sparse_negative_exponent():
+    """Test poly_from_sparse() rejects negative exponents"""
+    with pytest.raises(ValueError):
+        poly_from_sparse({-1: 1}, 'x')
+
+
+def test_build_expr():
+    """Test build_expr() builds nested functions from a tuple spec"""
+    x, = symbols('x')
+    result = build_expr(("fn", "sin", (("fn", "cos", (("sym", "x"),)),)))
+    assert str(result) == str(sin(cos(x)))
+
+
+def test_build_expr_rejects_bare_args():
+    """Test build_expr() requires the function args slot to be a sequence of specs"""
+    with pytest.raises(ValueError):
+        build_expr(("fn", "sin", ("sym", "x")))
+    with pytest.raises(ValueError):
+        build_expr(("fn", "sin", "xy"))
+
+
+def test_parse_bytes():
+    """Test parse_bytes() matches parse()"""
+    assert str(parse_bytes(b"x^2 + 2*x + 1")) == str(parse("x^2 + 2*x + 1"))
+
+
+def test_parse_bytes_invalid_utf8():
+    """Test parse_bytes() rejects input that is not valid UTF-8"""
+    with pytest.raises(ValueError, match="UTF-8"):
+        parse_bytes(b"x + \xff")
+
+
+def test_parse_and_simplify():
+    """Test parse_and_simplify() matches parse().simplify()"""
+    for s in ["x + x + x", "(x + 1) * (x + 2)", "sin(x)^2 + cos(x)^2"]:
+        assert str(parse_and_simplify(s)) == str(parse(s).simplify())
+
+
+def test_parse_and_simplify_invalid_input():
+    """Test parse_and_simplify() raises ValueError like parse()"""
+    with pytest.raises(ValueError, match="Parse error"):
+        parse_and_simplify("(x + 1")
+
+
+def test_parse_batch():
+    """Test parse_batch() matches parse() for each input"""
+    inputs = ["x^2 - 1", "sin(x)", "2*x + 3"]
+    results = parse_batch(inputs)
+    assert [str(r) for r in results] == [str(parse(s)) for s in inputs]
+
+
+def test_parse_batch_large_keeps_order():
+    """Test parse_batch() keeps input order for batches parsed across threads"""
+    inputs = [f"x + {i}" for i in range(2000)]
+    results = parse_batch(inputs)
+    assert [str(r) for r in results] == [str(parse(s)) for s in inputs]
+
+
+def test_parse_batch_invalid_input():
+    """Test parse_batch() raises ValueError naming the input that failed"""
+    with pytest.raises(ValueError, match=r"\(x \+ 1"):
+        parse_batch(["x^2 - 1", "(x + 1", "2*x + 3"])
+
+
+def test_simplify_many():
+    """Test simplify_many() matches simplify() for each input"""
+    exprs = [parse(s) for s in ["x + x", "(x + 1) * (x + 2)", "sin(x)^2 + cos(x)^2"]]
+    results = simplify_many(exprs)
+    assert [str(r) for r in results] == [str(e.simplify()) for e in exprs]
+
+
+def test_factor_and_expand_cached():
+    """Test factor_cached()/expand_cached() match factor()/expand() on repeat calls"""
+    for s in ["x^2 + 2*x", "(x + 1)^2", "2*x*y + 4*x"]:
+        expr = parse(s)
+        for _ in range(2):
+            assert str(factor_cached(expr)) == str(expr.factor())
+            assert str(expand_cached(parse(s))) == str(expr.expand())
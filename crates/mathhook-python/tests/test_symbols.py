@@ -5,7 +5,7 @@ multiple symbols with various syntaxes: space-separated, comma-separated,
 and range syntax.
 """
 import mathhook
-from mathhook import symbols
+from mathhook import symbols, symbol, intern_symbol
 
 
 def test_space_separated():
@@ -230,3 +230,11 @@ def test_trailing_comma_comma_sep():
     result = symbols('x,y,z,')
     assert len(result) == 3
     assert str(result[2]) == 'z'
+
+
+def test_intern_symbol():
+    """Test intern_symbol() returns one shared object per name"""
+    x = intern_symbol("x")
+    assert x is intern_symbol("x")
+    assert x is not intern_symbol("y")
+    assert str(x) == str(symbol("x"))